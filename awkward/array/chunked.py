@@ -450,6 +450,50 @@ class ChunkedArray(awkward.array.base.AwkwardArray):
             else:
                 raise TypeError("cannot interpret shape {0}, dtype {1} as a fancy index or mask".format(head.shape, head.dtype))
 
+    def histogram(self, bins, weights=None, per_event_weights=None, range=None):
+        # accumulates the histogram of each chunk; weights must be ChunkedArrays with the same chunk lengths
+        import awkward.array.jagged
+
+        if isinstance(bins, (numbers.Integral, numpy.integer)):
+            if range is None:
+                raise ValueError("range must be given with a number of bins, so that all chunks have the same edges")
+            edges = numpy.linspace(range[0], range[1], bins + 1)
+        else:
+            edges = numpy.asarray(bins)
+
+        chunks = [chunk for sofar, chunk in self._chunkiterator(0)]
+        weightchunks, eventweightchunks = [], []
+        for name, given, givenchunks in (("weights", weights, weightchunks), ("per_event_weights", per_event_weights, eventweightchunks)):
+            if given is not None:
+                if not isinstance(given, ChunkedArray):
+                    raise TypeError("{0} must be a ChunkedArray".format(name))
+                givenchunks.extend(chunk for sofar, chunk in given._chunkiterator(0))
+                if len(givenchunks) != len(chunks) or any(len(x) != len(chunk) for x, chunk in zip(givenchunks, chunks)):
+                    raise ValueError("{0} must have the same chunk lengths as the array: {1} instead of {2}".format(name, [len(x) for x in givenchunks], [len(x) for x in chunks]))
+
+        out = None
+        for i, chunk in enumerate(chunks):
+            w = weightchunks[i] if weights is not None else None
+            e = eventweightchunks[i] if per_event_weights is not None else None
+
+            if isinstance(chunk, awkward.array.jagged.JaggedArray):
+                hist, edges = chunk.histogram(edges, weights=w, per_event_weights=e)
+            else:
+                if w is not None and e is not None:
+                    w = w * e
+                elif w is None:
+                    w = e
+                hist, edges = numpy.histogram(chunk, edges, weights=w)
+
+            if out is None:
+                out = hist
+            else:
+                out = out + hist
+
+        if out is None:
+            out = numpy.zeros(len(edges) - 1, dtype=numpy.int64)
+        return out, edges
+
 class PartitionedArray(ChunkedArray):
     def __init__(self, offsets, chunks, writeable=True):
         super(PartitionedArray, self).__init__(chunks, writeable=writeable)
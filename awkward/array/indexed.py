@@ -34,6 +34,7 @@ import numbers
 import numpy
 
 import awkward.array.base
+import awkward.util
 
 class IndexedArray(awkward.array.base.AwkwardArray):
     def __init__(self, index, content, writeable=True):
@@ -138,7 +139,11 @@ class ByteIndexedArray(IndexedArray):
 
         starts = self._index[where]
 
-        if len(starts.shape) == 0:
+        if len(starts.shape) == 0 and self._content.strides[0] != 1:
+            # strided bytes cannot be a buffer; take the record's row instead
+            return self._viewrecords(numpy.ascontiguousarray(self._recordview()[starts]))[0]
+
+        elif len(starts.shape) == 0:
             pos, offset = divmod(starts, self._dtype.itemsize)
             return numpy.frombuffer(self._content, dtype=self._dtype, count=(pos + 1), offset=offset)[pos]
 
@@ -146,21 +151,12 @@ class ByteIndexedArray(IndexedArray):
             if len(starts) == 0:
                 return numpy.empty(0, dtype=self._dtype)
 
-            else:
-                hold = numpy.empty(len(starts), dtype=self._dtype)
-
-                contidx = numpy.empty(len(starts) * self._dtype.itemsize, dtype=self.INDEXTYPE)
-                contidx[::self._dtype.itemsize] = starts
-                for offset in range(1, self._dtype.itemsize):
-                    contidx[offset::self._dtype.itemsize] = contidx[::self._dtype.itemsize] + offset
-                
-                holdidx = numpy.empty(len(starts) * self._dtype.itemsize, dtype=self.INDEXTYPE)
-                holdidx[::self._dtype.itemsize] = numpy.arange(0, len(starts) * self._dtype.itemsize, self._dtype.itemsize)
-                for offset in range(1, self._dtype.itemsize):
-                    holdidx[offset::self._dtype.itemsize] = holdidx[::self._dtype.itemsize] + offset
+            elif self._isaligned(starts):
+                return self._typedview()[starts // self._dtype.itemsize]
 
-                numpy.frombuffer(hold, dtype=self.CHARTYPE)[holdidx] = self._content[contidx]
-                return hold
+            else:
+                # one fancy-index of whole records: row i of the strided view is the itemsize bytes starting at byte i
+                return self._viewrecords(numpy.ascontiguousarray(self._recordview()[starts]))
 
     def __setitem__(self, where, what):
         if self._isstring(where):
@@ -172,26 +168,138 @@ class ByteIndexedArray(IndexedArray):
 
         starts = self._index[where]
 
-        if len(starts.shape) == 0:
+        if len(starts.shape) == 0 and self._content.strides[0] != 1:
+            hold = numpy.empty(1, dtype=self._dtype)
+            hold[0] = what
+            self._recordview()[starts] = hold.view(self.CHARTYPE).reshape(self._dtype.itemsize)
+
+        elif len(starts.shape) == 0:
             pos, offset = divmod(starts, self._dtype.itemsize)
             buf = numpy.frombuffer(self._content, dtype=self._dtype, count=(pos + 1), offset=offset)
             buf[pos] = what
 
         elif len(starts) != 0:
-            hold = numpy.empty(len(starts), dtype=self._dtype)
-            hold[:] = what
+            if self._isaligned(starts):
+                self._typedview()[starts // self._dtype.itemsize] = what
 
-            contidx = numpy.empty(len(starts) * self._dtype.itemsize, dtype=self.INDEXTYPE)
-            contidx[::self._dtype.itemsize] = starts
-            for offset in range(1, self._dtype.itemsize):
-                contidx[offset::self._dtype.itemsize] = contidx[::self._dtype.itemsize] + offset
+            else:
+                hold = numpy.empty(len(starts), dtype=self._dtype)
+                hold[:] = what
+                self._recordview()[starts] = hold.view(self.CHARTYPE).reshape(len(starts), self._dtype.itemsize)
+
+    def _isaligned(self, starts):
+        # record (structured) dtypes are faster to move as rows of bytes, even when aligned;
+        # strided (non-contiguous) bytes cannot be viewed as dtype, so they also take the row path
+        return self._dtype.fields is None and self._content.strides[0] == 1 and bool((starts % self._dtype.itemsize == 0).all())
+
+    def _viewrecords(self, data):
+        # contiguous bytes reinterpreted as records; a subarray dtype becomes extra dimensions, as in numpy.empty
+        if self._dtype.subdtype is None:
+            return data.view(self._dtype).reshape(-1)
+        else:
+            base, shape = self._dtype.subdtype
+            return data.view(base).reshape((-1,) + shape)
 
-            holdidx = numpy.empty(len(starts) * self._dtype.itemsize, dtype=self.INDEXTYPE)
-            holdidx[::self._dtype.itemsize] = numpy.arange(0, len(starts) * self._dtype.itemsize, self._dtype.itemsize)
-            for offset in range(1, self._dtype.itemsize):
-                holdidx[offset::self._dtype.itemsize] = holdidx[::self._dtype.itemsize] + offset
+    def _typedview(self):
+        # the whole buffer reinterpreted as dtype; only valid for positions that are multiples of itemsize
+        itemsize = self._dtype.itemsize
+        return self._viewrecords(self._content[:len(self._content) - len(self._content) % itemsize])
 
-            self._content[contidx] = numpy.frombuffer(hold, dtype=self.CHARTYPE)
+    def _recordview(self):
+        # overlapping (len(content) - itemsize + 1, itemsize) view of the bytes, without copying them
+        itemsize = self._dtype.itemsize
+        stride = self._content.strides[0]
+        return numpy.lib.stride_tricks.as_strided(self._content, shape=(max(len(self._content) - itemsize + 1, 0), itemsize), strides=(stride, stride))
+
+class CategoricalArray(IndexedArray):
+    # dictionary encoding: content holds each distinct value once and index holds the smallest integer codes that fit
+
+    @classmethod
+    def fromvalues(cls, values, writeable=True):
+        values = numpy.asarray(values)
+        if len(values.shape) != 1:
+            raise TypeError("values must have 1-dimensional shape")
+        content, index = numpy.unique(values, return_inverse=True)
+        return cls(index.astype(cls._indextype(len(content))), content, writeable=writeable)
+
+    @staticmethod
+    def _indextype(size):
+        for dtype in numpy.uint8, numpy.uint16, numpy.uint32:
+            if size <= numpy.iinfo(dtype).max + 1:
+                return numpy.dtype(dtype)
+        return numpy.dtype(numpy.uint64)
+
+    def __getitem__(self, where):
+        if self._isstring(where):
+            return CategoricalArray(self._index, self._content[where], writeable=self._writeable)
+
+        return super(CategoricalArray, self).__getitem__(where)
+
+    def __setitem__(self, where, what):
+        # the dictionary is shared by every row with the same code, so assignment changes codes, not dictionary entries
+        if self._isstring(where):
+            raise TypeError("cannot assign to a field of a CategoricalArray; its dictionary entries are shared")
+        if not self._writeable:
+            raise ValueError("assignment destination is read-only")
+
+        values, inverse = numpy.unique(numpy.asarray(what), return_inverse=True)
+
+        # new values take the dictionary's dtype (longer strings widen it), as long as nothing is lost
+        dtype = self._content.dtype
+        if values.dtype.kind == dtype.kind and dtype.kind in ("S", "U"):
+            dtype = numpy.promote_types(dtype, values.dtype)
+        cast = values.astype(dtype)
+        back = cast.astype(values.dtype)
+        if not ((back == values) | ((back != back) & (values != values))).all():
+            raise ValueError("cannot assign {0} values to a CategoricalArray with dictionary dtype {1} without losing information".format(values.dtype, self._content.dtype))
+        values = cast
+
+        order = numpy.argsort(self._content, kind="mergesort")
+        pos = numpy.searchsorted(self._content[order], values)
+        found = (pos < len(order))
+        found[found] = (self._content[order[pos[found]]] == values[found])
+
+        codes = numpy.empty(len(values), dtype=self.INDEXTYPE)
+        codes[found] = order[pos[found]]
+        numnew = len(values) - numpy.count_nonzero(found)
+        if numnew != 0:
+            codes[~found] = numpy.arange(len(self._content), len(self._content) + numnew)
+            self._content = numpy.concatenate([self._content, values[~found]])
+            indextype = self._indextype(len(self._content))
+            if indextype.itemsize > self._index.dtype.itemsize:
+                self._index = self._index.astype(indextype)
+
+        self._index[where] = codes[inverse].reshape(numpy.shape(what))
+
+    def _isscalar(self, value):
+        return len(self._content.shape) == 1 and isinstance(value, (numbers.Number, numpy.generic, bytes, awkward.util.string))
+
+    def _equal(self, value):
+        # compare the (small) dictionary with value, then only the codes
+        match = (self._content == value)
+        codes = numpy.nonzero(match)[0]
+        if len(codes) == 0:
+            return numpy.zeros(len(self._index), dtype=numpy.bool_)
+        elif len(codes) == 1:
+            return self._index == self._index.dtype.type(codes[0])
+        else:
+            return match[self._index]
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "__call__" and ufunc in (numpy.equal, numpy.not_equal) and len(inputs) == 2 and len(kwargs) == 0:
+            other = inputs[1] if inputs[0] is self else inputs[0]
+            if self._isscalar(other):
+                out = self._equal(other)
+                if ufunc is numpy.equal:
+                    return out
+                else:
+                    return numpy.logical_not(out)
+
+        inputs = [x._content[x._index] if isinstance(x, CategoricalArray) else x for x in inputs]
+        if method == "__call__" and ufunc in (numpy.equal, numpy.not_equal) and len(inputs) == 2 and len(kwargs) == 0:
+            # string dtypes have no equal ufunc (in older numpy), only the operators
+            return inputs[0] == inputs[1] if ufunc is numpy.equal else inputs[0] != inputs[1]
+        return getattr(ufunc, method)(*inputs, **kwargs)
 
 class IndexedMaskedArray(IndexedArray):
     def __init__(self, index, content, maskedwhen=-1, writeable=True):
@@ -43,14 +43,12 @@ class JaggedArray(awkward.array.base.AwkwardArray):
 
     @classmethod
     def fromcounts(cls, counts, content, writeable=True):
-        offsets = numpy.empty(len(counts) + 1, JaggedArray.INDEXTYPE)
-        offsets[0] = 0
-        numpy.cumsum(counts, offsets[1:])
+        offsets = JaggedArray.counts2offsets(counts)
         return cls(offsets[:-1], offsets[1:], content, writeable=writeable)
 
     @classmethod
     def fromuniques(cls, uniques, content, writeable=True):
-        uniques = JaggedArray._toarray(uniques, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+        uniques = cls._toarray(uniques, cls.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
         if len(uniques) != len(content):
             raise ValueError("uniques array must have the same length as content")
         changes = numpy.nonzero(uniques[1:] != uniques[:-1])[0] + 1
@@ -61,6 +59,22 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         starts, stops = offsets[:-1], offsets[1:]
         return JaggedArray(starts, stops, content, writeable=writeable)
 
+    @classmethod
+    def groupby(cls, keys, content, return_keys=False, writeable=True):
+        # unsorted keys: one stable argsort, one gather of the content, offsets from the run lengths of the sorted keys
+        keys = cls._toarray(keys, cls.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+        content = cls._toarray(content, cls.CHARTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+        if len(keys) != len(content):
+            raise ValueError("keys array must have the same length as content")
+        order = numpy.argsort(keys, kind="mergesort")
+        uniques, counts = numpy.unique(keys[order], return_counts=True)
+        out = cls.fromcounts(counts, content[order], writeable=writeable)
+        if return_keys:
+            # sublist i holds the content with key uniques[i]
+            return out, uniques
+        else:
+            return out
+
     @classmethod
     def fromparents(cls, parents, content, writeable=True):
         if len(parents) != len(content):
@@ -94,6 +108,21 @@ class JaggedArray(awkward.array.base.AwkwardArray):
             content.extend(x)
         return cls(offsets[:-1], offsets[1:], content, writeable=writeable)
 
+    @classmethod
+    def fromregular(cls, regular, writeable=True):
+        # the reverse of pad: every row of a 2-d array becomes a sublist, dropping entries masked by numpy.ma
+        mask = numpy.ma.getmaskarray(regular) if isinstance(regular, numpy.ma.MaskedArray) else None
+        regular = numpy.ma.getdata(regular)
+        if len(regular.shape) < 2:
+            raise TypeError("regular array must have at least 2 dimensions")
+
+        if mask is None or not mask.any():
+            offsets = numpy.arange(regular.shape[0] + 1, dtype=cls.INDEXTYPE) * regular.shape[1]
+            return cls.fromoffsets(offsets, regular.reshape((-1,) + regular.shape[2:]), writeable=writeable)
+
+        keep = ~mask.reshape(mask.shape[:2] + (-1,)).all(axis=2)
+        return cls.fromcounts(keep.sum(axis=1), regular[keep], writeable=writeable)
+
     @staticmethod
     def compatible(*jaggedarrays):
         if not all(isinstance(x, JaggedArray) for x in jaggedarrays):
@@ -109,7 +138,7 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         for next in jaggedarrays[1:]:
             if first._starts is not next._starts:
                 if relevant is None:
-                    relevant = (first.counts != 0)
+                    relevant = (first._counts() != 0)
                 if relevantstarts is None:
                     relevantstarts = first._starts[relevant]
                 if not numpy.array_equal(relevantstarts, next._starts[relevant]):
@@ -117,7 +146,7 @@ class JaggedArray(awkward.array.base.AwkwardArray):
 
             if first._stops is not next._stops:
                 if relevant is None:
-                    relevant = (first.counts != 0)
+                    relevant = (first._counts() != 0)
                 if relevantstops is None:
                     relevantstops = first._stops[relevant]
                 if not numpy.array_equal(relevantstops, next._stops[relevant]):
@@ -125,6 +154,62 @@ class JaggedArray(awkward.array.base.AwkwardArray):
 
         return True
 
+    @staticmethod
+    def concatenate(arrays, axis=0):
+        arrays = [x.tojagged(copy=False) if isinstance(x, ByteJaggedArray) else x for x in arrays]
+        if len(arrays) == 0:
+            raise ValueError("need at least one array to concatenate")
+        if not all(isinstance(x, JaggedArray) for x in arrays):
+            raise TypeError("not all objects passed to JaggedArray.concatenate are JaggedArrays")
+
+        # every input's content is flattened into one concatenated array
+        flats = [x.flatten() for x in arrays]
+        content = JaggedArray._concatenatecontent(flats)
+        counts = [x._counts() for x in arrays]
+
+        if axis == 0:
+            return JaggedArray.fromcounts(numpy.concatenate(counts), content)
+
+        elif axis == 1:
+            if any(len(x) != len(arrays[0]) for x in arrays):
+                raise ValueError("arrays must have the same number of sublists to concatenate along axis 1")
+
+            # interleave: element l of array j's sublist i goes after array 0..j-1's elements of sublist i
+            offsets = JaggedArray.counts2offsets(sum(counts))
+            before = offsets[:-1].copy()
+            index = numpy.empty(offsets[-1], dtype=JaggedArray.INDEXTYPE)
+            base = 0
+            for flat, count in zip(flats, counts):
+                flatoffsets = JaggedArray.counts2offsets(count)
+                parents = JaggedArray.offsets2parents(flatoffsets)
+                local = numpy.arange(len(flat), dtype=JaggedArray.INDEXTYPE) - flatoffsets[:-1][parents]
+                index[before[parents] + local] = numpy.arange(base, base + len(flat), dtype=JaggedArray.INDEXTYPE)
+                before += count
+                base += len(flat)
+            return JaggedArray.fromoffsets(offsets, content[index])
+
+        else:
+            raise ValueError("axis must be 0 or 1")
+
+    @staticmethod
+    def _concatenatecontent(flats):
+        import awkward.array.table
+        if all(isinstance(x, numpy.ndarray) for x in flats):
+            return numpy.concatenate(flats)
+
+        elif all(isinstance(x, awkward.array.table.Table) for x in flats):
+            # column by column, so that the result is a Table and not an object array of Table.Rows
+            names = list(flats[0]._content)
+            if any(set(x._content) != set(names) for x in flats[1:]):
+                raise ValueError("Table contents must have the same columns to concatenate")
+            return awkward.array.table.Table(sum(len(x) for x in flats), collections.OrderedDict((n, JaggedArray._concatenatecontent([x[n] for x in flats])) for n in names))
+
+        elif all(isinstance(x, JaggedArray) for x in flats):
+            return JaggedArray.concatenate(flats, axis=0)
+
+        else:
+            raise TypeError("cannot concatenate contents of type {0}".format(", ".join(sorted(set(type(x).__name__ for x in flats)))))
+
     def __init__(self, starts, stops, content, writeable=True):
         self.starts = starts
         self.stops = stops
@@ -138,9 +223,12 @@ class JaggedArray(awkward.array.base.AwkwardArray):
     @starts.setter
     def starts(self, value):
         value = self._toarray(value, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+        if len(value) == 0 and not issubclass(value.dtype.type, numpy.integer):
+            value = numpy.empty(0, dtype=self.INDEXTYPE)
         if (value < 0).any():
             raise ValueError("starts must be a non-negative array")
         self._starts = value
+        self._derived = {}
 
     @property
     def stops(self):
@@ -149,9 +237,12 @@ class JaggedArray(awkward.array.base.AwkwardArray):
     @stops.setter
     def stops(self, value):
         value = self._toarray(value, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+        if len(value) == 0 and not issubclass(value.dtype.type, numpy.integer):
+            value = numpy.empty(0, dtype=self.INDEXTYPE)
         if (value < 0).any():
             raise ValueError("stops must be a non-negative array")
         self._stops = value
+        self._derived = {}
 
     @property
     def content(self):
@@ -185,31 +276,132 @@ class JaggedArray(awkward.array.base.AwkwardArray):
                 len(self._starts) == len(self._starts.base) - 1 and
                 len(self._stops) == len(self._stops.base) - 1)
 
+    # offsets, counts and parents are derived from starts and stops (and the length of content) and kept
+    # until the starts or stops setter runs; the cached arrays are read-only because they are shared between
+    # calls (and with arrays that __array_ufunc__ makes with the same starts and stops), so internal code uses
+    # them through _offsets(), _counts() and _parents(); the public properties return writable copies, which
+    # cost a copy per access and save only the derivation, not the allocation
+
+    def _derive(self, key, function):
+        try:
+            return self._derived[key]
+        except KeyError:
+            out = function()
+            if isinstance(out, numpy.ndarray):
+                out.flags.writeable = False
+            self._derived[key] = out
+            return out
+
+    @property
+    def derivednbytes(self):
+        return sum(x.nbytes for x in self._derived.values() if isinstance(x, numpy.ndarray))
+
+    def clearderived(self):
+        # needed only if starts or stops are modified in place
+        self._derived = {}
+
+    def _offsets(self):
+        if self._offsets_is_aliased():
+            return self._starts.base
+
+        def offsets():
+            if numpy.array_equal(self._starts[1:], self.stops[:-1]):
+                return numpy.append(self._starts, self.stops[-1])
+            else:
+                return None
+
+        out = self._derive("offsets", offsets)
+        if out is None:
+            raise ValueError("starts and stops are not compatible with a single offsets array")
+        return out
+
     @property
     def offsets(self):
         if self._offsets_is_aliased():
             return self._starts.base
-        elif numpy.array_equal(self._starts[1:], self.stops[:-1]):
-            return numpy.append(self._starts, self.stops[-1])
         else:
-            raise ValueError("starts and stops are not compatible with a single offsets array")
+            return self._offsets().copy()
+
+    def _counts(self):
+        return self._derive("counts", lambda: self._stops[:len(self._starts)] - self._starts)
 
     @property
     def counts(self):
-        return self._stops - self._starts
+        return self._counts().copy()
+
+    @staticmethod
+    def counts2offsets(counts):
+        offsets = numpy.empty(len(counts) + 1, dtype=JaggedArray.INDEXTYPE)
+        offsets[0] = 0
+        numpy.cumsum(counts, out=offsets[1:])
+        return offsets
+
+    @staticmethod
+    def offsets2parents(offsets, length=None):
+        offsets = numpy.array(offsets, dtype=JaggedArray.INDEXTYPE, copy=False)
+        if length is None:
+            length = offsets[-1] if len(offsets) != 0 else 0
+
+        out = numpy.full(length, -1, dtype=JaggedArray.INDEXTYPE)
+        if len(offsets) < 2:
+            return out
+
+        # count sublist boundaries at each content position, then a running sum assigns each position to its sublist
+        first, last = offsets[0], offsets[-1]
+        boundaries = numpy.bincount(offsets[1:-1] - first, minlength=last - first + 1)
+        numpy.cumsum(boundaries[:last - first], out=out[first:last])
+        return out
+
+    @staticmethod
+    def startsstops2parents(starts, stops, length):
+        out = numpy.full(length, -1, dtype=JaggedArray.INDEXTYPE)
+        stops = stops[:len(starts)]         # stops may be longer than starts (see __len__)
+        nonempty = numpy.nonzero(stops > starts)[0]
+        if len(nonempty) == 0:
+            return out
+
+        # scatter each sublist's index and start position at its start, then carry the most recent start forward
+        firsts = starts[nonempty]
+        out[firsts] = nonempty
+        recent = numpy.full(length, -1, dtype=JaggedArray.INDEXTYPE)
+        recent[firsts] = firsts
+        numpy.maximum.accumulate(recent, out=recent)
+
+        good = (recent >= 0)
+        out[good] = out[recent[good]]
+
+        # positions past the stop of the most recent sublist belong to no sublist
+        good[good] = numpy.arange(length, dtype=JaggedArray.INDEXTYPE)[good] < stops[out[good]]
+        out[~good] = -1
+        return out
+
+    def _parents(self):
+        return self._derive(("parents", len(self._content)), self._makeparents)
 
     @property
     def parents(self):
-        out = numpy.full(len(self._content), -1, dtype=self.INDEXTYPE)
-        starts, stops = self._starts, self._stops
-        lenstarts = len(starts)
-        i = 0
-        while i < lenstarts:
-            out[starts[i]:stops[i]] = i
-            i += 1
-        return out
+        return self._parents().copy()
+
+    def _makeparents(self):
+        if len(self._starts) == 0:
+            return numpy.full(len(self._content), -1, dtype=self.INDEXTYPE)
+
+        try:
+            offsets = self._offsets()
+        except ValueError:
+            return self.startsstops2parents(self._starts, self._stops, len(self._content))
+        else:
+            return self.offsets2parents(offsets, len(self._content))
+
+    @property
+    def localindex(self):
+        parents = self._parents()
+        content = numpy.arange(len(parents), dtype=self.INDEXTYPE)
+        if len(self._starts) != 0:
+            content -= self._starts[parents]     # positions outside any sublist (parent -1) are overwritten below
+        content[parents < 0] = -1
+        return JaggedArray(self._starts, self._stops, content, writeable=self._writeable)
 
-        
     def __len__(self):                 # length is determined by starts
         return len(self._starts)       # data can grow by appending contents and stops before starts
 
@@ -240,6 +432,18 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         if self._isstring(where):
             return JaggedArray(self._starts, self._stops, self._content[where], writeable=self._writeable)
 
+        if isinstance(where, JaggedArray):
+            return self._getjagged(where)
+
+        if isinstance(where, tuple) and len(where) == 1:
+            where = where[0]
+        elif isinstance(where, tuple) and len(where) > 1:
+            head = self[where[0]]
+            if isinstance(head, JaggedArray):
+                return head._getinner(where[1], where[2:])
+            else:
+                return head[where[1:]]
+
         self._check_startsstops()
         starts = self._starts[where]
         stops = self._stops[where]
@@ -249,9 +453,103 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         else:
             return JaggedArray(starts, stops, self._content, writeable=self._writeable)
 
+    def _getinner(self, where, tail):
+        # index the second dimension of every sublist at once; tail applies to the content's dimensions
+        import awkward.array.indexed
+
+        self._check_startsstops()
+        starts = self._starts
+        counts = self._stops[:len(starts)] - starts
+        content = self._content if len(tail) == 0 else self._content[(slice(None),) + tail]
+
+        if isinstance(where, (numbers.Integral, numpy.integer)):
+            local = numpy.full(len(starts), where, dtype=self.INDEXTYPE)
+            if where < 0:
+                local += counts
+            good = (local >= 0) & (local < counts)
+            if good.all():
+                return content[starts + local]
+            else:
+                # sublists too short for this index become masked instead of raising IndexError
+                index = numpy.where(good, starts + local, -1)
+                return awkward.array.indexed.IndexedMaskedArray(index, content, maskedwhen=-1, writeable=self._writeable)
+
+        elif isinstance(where, slice):
+            step = 1 if where.step is None else where.step
+            if step == 0:
+                raise ValueError("slice step cannot be zero")
+
+            # vectorized slice.indices(count) for every sublist
+            if step > 0:
+                lower, upper, start, stop = 0, counts, 0, counts
+            else:
+                lower, upper, start, stop = -1, counts - 1, counts - 1, -1
+            if where.start is not None:
+                start = numpy.clip(where.start + (counts if where.start < 0 else 0), lower, upper)
+            if where.stop is not None:
+                stop = numpy.clip(where.stop + (counts if where.stop < 0 else 0), lower, upper)
+            start = numpy.broadcast_to(start, counts.shape).astype(self.INDEXTYPE)
+            stop = numpy.broadcast_to(stop, counts.shape).astype(self.INDEXTYPE)
+
+            if step == 1:
+                # only the starts and stops change; the content is shared
+                return JaggedArray(starts + start, starts + numpy.maximum(start, stop), content, writeable=self._writeable)
+
+            newcounts = numpy.maximum((stop - start + step - (1 if step > 0 else -1)) // step, 0)
+            offsets = self.counts2offsets(newcounts)
+            parents = self.offsets2parents(offsets)
+            index = numpy.arange(offsets[-1], dtype=self.INDEXTYPE) - offsets[:-1][parents]
+            index *= step
+            index += starts[parents] + start[parents]
+            return JaggedArray.fromoffsets(offsets, content[index], writeable=self._writeable)
+
+        else:
+            raise IndexError("only integers and slices are supported as the inner index of a JaggedArray")
+
+    def _getjagged(self, where):
+        # select objects within each sublist by a jagged boolean mask or a jagged array of local indices
+        if len(where) != len(self._starts):
+            raise IndexError("jagged index must have the same number of sublists as the array")
+        if isinstance(where, ByteJaggedArray):
+            where = where.tojagged(copy=False)
+        self._check_startsstops()
+
+        counts = self._stops[:len(self._starts)] - self._starts
+        mask = where._content[self._contentindex(where._starts, where._counts())]
+
+        if issubclass(mask.dtype.type, numpy.bool_):
+            if not numpy.array_equal(where._counts(), counts):
+                raise IndexError("jagged boolean mask must have the same counts as the array")
+            index = self._contentindex(self._starts, counts)[mask]
+            newcounts = numpy.bincount(self.offsets2parents(self.counts2offsets(counts))[mask], minlength=len(counts)).astype(self.INDEXTYPE)
+
+        elif issubclass(mask.dtype.type, numpy.integer) or len(mask) == 0:
+            newcounts = where._counts().astype(self.INDEXTYPE)
+            parents = self.offsets2parents(self.counts2offsets(newcounts))
+            local = mask.astype(self.INDEXTYPE)
+            local[local < 0] += counts[parents][local < 0]
+            if ((local < 0) | (local >= counts[parents])).any():
+                raise IndexError("jagged index out of bounds for its sublist")
+            index = self._starts[parents] + local
+
+        else:
+            raise IndexError("jagged index must have boolean or integer content")
+
+        offsets = self.counts2offsets(newcounts)
+        parents = self.offsets2parents(offsets)
+
+        # if every selection is a run of consecutive elements, only starts and stops need to change
+        if (numpy.diff(index)[parents[1:] == parents[:-1]] == 1).all():
+            starts = self._starts.copy()
+            nonempty = newcounts > 0
+            starts[nonempty] = index[offsets[:-1][nonempty]]
+            return JaggedArray(starts, starts + newcounts, self._content, writeable=self._writeable)
+
+        return JaggedArray.fromoffsets(offsets, self._content[index], writeable=self._writeable)
+
     def __setitem__(self, where, what):
         if self._isstring(where):
-            JaggedArray(self._starts, self._stops, self._content[where], writeable=writeable)[:] = what
+            JaggedArray(self._starts, self._stops, self._content[where], writeable=self._writeable)[:] = what
             return
 
         if not self._writeable:
@@ -263,29 +561,46 @@ class JaggedArray(awkward.array.base.AwkwardArray):
 
         if len(starts.shape) == len(stops.shape) == 0:
             self._content[starts:stops] = what
+            return
 
-        elif isinstance(what, JaggedArray):
+        # every assignment below is one scatter into the content positions of the selected sublists
+        counts = stops - starts
+        index = self._contentindex(starts, counts)
+
+        if isinstance(what, ByteJaggedArray):
+            what = what.tojagged(copy=False)
+
+        if isinstance(what, JaggedArray):
             if len(what) != len(starts):
                 raise ValueError("cannot copy JaggedArray with length {0} to JaggedArray with dimension {1}".format(len(what), len(starts)))
-            for which, start, stop in awkward.util.izip(what, starts, stops):
-                self._content[start:stop] = which
+
+            whatcounts = what._counts()
+            if numpy.array_equal(whatcounts, counts):
+                whatindex = what._contentindex(what._starts, counts)
+
+            else:
+                # as in Numpy, a length-1 sublist broadcasts to fill its destination
+                broadcast = (whatcounts == 1)
+                if not (broadcast | (whatcounts == counts)).all():
+                    raise ValueError("cannot copy JaggedArray into JaggedArray with different sublist lengths")
+                offsets = self.counts2offsets(counts)
+                parents = self.offsets2parents(offsets)
+                whatindex = numpy.arange(len(index), dtype=self.INDEXTYPE) - offsets[:-1][parents]
+                whatindex[broadcast[parents]] = 0
+                whatindex += what._starts[parents]
+
+            self._content[index] = what._content[whatindex]
 
         elif isinstance(what, (collections.Sequence, numpy.ndarray, awkward.array.base.AwkwardArray)) and len(what) == 1:
-            for start, stop in awkward.util.izip(starts, stops):
-                self._content[start:stop] = what[0]
+            self._content[index] = what[0]
 
         elif isinstance(what, (collections.Sequence, numpy.ndarray, awkward.array.base.AwkwardArray)):
-            if len(what) != (stops - starts).sum():
-                raise ValueError("cannot copy sequence with length {0} to JaggedArray with dimension {1}".format(len(what), (stops - starts).sum()))
-            this = next = 0
-            for start, stop in awkward.util.izip(starts, stops):
-                next += stop - start
-                self._content[start:stop] = what[this:next]
-                this = next
+            if len(what) != len(index):
+                raise ValueError("cannot copy sequence with length {0} to JaggedArray with dimension {1}".format(len(what), len(index)))
+            self._content[index] = what
 
         else:
-            for start, stop in awkward.util.izip(starts, stops):
-                self._content[start:stop] = what
+            self._content[index] = what
 
     def tojagged(self, starts=None, stops=None, copy=True, writeable=True):
         if starts is None and stops is None:
@@ -299,7 +614,7 @@ class JaggedArray(awkward.array.base.AwkwardArray):
             if len(self) != len(starts):
                 raise IndexError("cannot fit JaggedArray of length {0} into starts of length {1}".format(len(self), len(starts)))
 
-            stops = starts + self.counts
+            stops = starts + self._counts()
 
             if (stops[:-1] > starts[1:]).any():
                 raise IndexError("cannot fit contents of JaggedArray into the given starts array")
@@ -309,13 +624,15 @@ class JaggedArray(awkward.array.base.AwkwardArray):
             if len(self) != len(stops):
                 raise IndexError("cannot fit JaggedArray of length {0} into stops of length {1}".format(len(self), len(stops)))
 
-            starts = stops - self.counts
+            starts = stops - self._counts()
 
             if (stops[:-1] > starts[1:]).any():
                 raise IndexError("cannot fit contents of JaggedArray into the given stops array")
 
         else:
-            if not numpy.array_equal(stops - starts, self.counts):
+            starts = self._toarray(starts, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+            stops = self._toarray(stops, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+            if not numpy.array_equal(stops - starts, self._counts()):
                 raise IndexError("cannot fit contents of JaggedArray into the given starts and stops arrays")
 
         if not copy and starts is self._starts and stops is self._stops:
@@ -328,20 +645,88 @@ class JaggedArray(awkward.array.base.AwkwardArray):
                 return JaggedArray(starts, stops, self._content, writeable=writeable)
 
         else:
-            selfstarts, selfstops, selfcontent = self._starts, self._stops, self._content
-            content = numpy.empty(stops.max(), dtype=selfcontent.dtype)
-            
-            lenstarts = len(starts)
-            i = 0
-            while i < lenstarts:
-                content[starts[i]:stops[i]] = selfcontent[selfstarts[i]:selfstops[i]]
-                i += 1
-            
+            counts = stops - starts
+            selfindex = self._contentindex(self._starts, counts)
+
+            if self._isoffsets(starts, stops):
+                content = self._content[selfindex]
+            else:
+                content = numpy.empty((stops.max() if len(stops) != 0 else 0,) + self._content.shape[1:], dtype=self._content.dtype)
+                content[self._contentindex(starts, counts)] = self._content[selfindex]
+
             return JaggedArray(starts, stops, content, writeable=writeable)
 
+    @staticmethod
+    def _isoffsets(starts, stops):
+        # true if starts and stops tile [0, stops[-1]) in order, so that content needs no gaps
+        return len(starts) == 0 or (starts[0] == 0 and numpy.array_equal(starts[1:], stops[:-1]))
+
+    @staticmethod
+    def _contentindex(starts, counts):
+        # content positions of every [starts[i], starts[i] + counts[i]) range, concatenated in order
+        offsets = JaggedArray.counts2offsets(counts)
+        index = numpy.arange(offsets[-1], dtype=JaggedArray.INDEXTYPE)
+        if len(index) != 0:
+            index += (starts - offsets[:-1])[JaggedArray.offsets2parents(offsets)]
+        return index
+
+    def compact(self):
+        if len(self._starts) == 0:
+            return self
+
+        try:
+            offsets = self._offsets()
+        except ValueError:
+            counts = self._counts()
+            return JaggedArray.fromoffsets(self.counts2offsets(counts), self._content[self._contentindex(self._starts, counts)], writeable=self._writeable)
+        else:
+            if self._offsets_is_aliased():
+                return self
+            else:
+                return JaggedArray.fromoffsets(offsets, self._content, writeable=self._writeable)
+
+    def flatten(self):
+        if len(self._starts) == 0:
+            return self._content[:0]
+        try:
+            offsets = self._offsets()
+        except ValueError:
+            return self._content[self._contentindex(self._starts, self._counts())]
+        else:
+            # contiguous: a slice of the content, no copy
+            return self._content[offsets[0]:offsets[-1]]
+
+    def pad(self, n, clip=True, fill=None):
+        '''
+        Regularizes to a (len(self), width) array, where width is n if `clip` (longer sublists are truncated) or max(n, longest sublist) if not. Missing entries are masked in a numpy.ma.MaskedArray, or set to `fill` in a plain ndarray if `fill` is given.
+        '''
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        counts = self._counts()
+        width = n if clip or len(counts) == 0 else max(n, counts.max())
+        taken = numpy.minimum(counts, width)
+
+        offsets = self.counts2offsets(taken)
+        parents = self.offsets2parents(offsets)
+        local = numpy.arange(offsets[-1], dtype=self.INDEXTYPE) - offsets[:-1][parents]
+
+        shape = (len(counts), width) + self._content.shape[1:]
+        if fill is None:
+            out = numpy.zeros(shape, dtype=self._content.dtype)
+        else:
+            out = numpy.full(shape, fill, dtype=numpy.result_type(self._content.dtype, numpy.array(fill)))
+        out[parents, local] = self._content[self._starts[parents] + local]
+
+        if fill is None:
+            mask = (numpy.arange(width, dtype=self.INDEXTYPE) >= taken[:, numpy.newaxis])
+            mask = mask.reshape(mask.shape + (1,)*(len(shape) - 2)) | numpy.zeros(shape, dtype=numpy.bool_)
+            return numpy.ma.MaskedArray(out, mask)
+        else:
+            return out
+
     def makecompatible(self, data, writeable=True):
         data = self._toarray(data, self._content.dtype, (numpy.ndarray, awkward.array.base.AwkwardArray))
-        parents = self.parents
+        parents = self._parents()
         good = (parents >= 0)
         content = numpy.empty(len(parents), dtype=data.dtype)
         if len(data.shape) == 0:
@@ -351,6 +736,25 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         return JaggedArray(self._starts, self._stops, content, writeable=writeable)
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "reduce":
+            if len(inputs) != 1 or inputs[0] is not self or kwargs.get("axis", -1) not in (1, -1) or kwargs.get("out", None) is not None:
+                return NotImplemented
+            # the identity depends on the item dtype, which for a ByteJaggedArray is not the content's uint8
+            jagged = self.tojagged(copy=False) if isinstance(self, ByteJaggedArray) else self
+            if ufunc.identity is None and ufunc not in (numpy.minimum, numpy.maximum):
+                identity = None
+            else:
+                identity = self._identity(ufunc, jagged._content.dtype)
+            return jagged._reduce(ufunc, identity, dtype=kwargs.get("dtype", None))
+
+        if method == "accumulate":
+            if len(inputs) != 1 or inputs[0] is not self or kwargs.get("axis", -1) not in (1, -1) or kwargs.get("out", None) is not None:
+                return NotImplemented
+            # the segmented scan regroups terms, so only associative ufuncs give the sequential answer
+            if ufunc not in (numpy.add, numpy.multiply, numpy.maximum, numpy.minimum, numpy.fmax, numpy.fmin, numpy.logical_and, numpy.logical_or, numpy.bitwise_and, numpy.bitwise_or, numpy.bitwise_xor):
+                return NotImplemented
+            return self._accumulate(ufunc, dtype=kwargs.get("dtype", None))
+
         if method != "__call__":
             return NotImplemented
 
@@ -382,7 +786,7 @@ class JaggedArray(awkward.array.base.AwkwardArray):
             if isinstance(inputs[i], numpy.ndarray):
                 data = self._toarray(inputs[i], inputs[i].dtype, (numpy.ndarray, awkward.array.base.AwkwardArray))
                 if parents is None:
-                    parents = jaggedarray.parents
+                    parents = jaggedarray._parents()
                     good = (parents >= 0)
 
                 content = numpy.empty(len(parents), dtype=data.dtype)
@@ -392,6 +796,10 @@ class JaggedArray(awkward.array.base.AwkwardArray):
                     content[good] = data[parents[good]]
                 inputs[i] = JaggedArray(starts, stops, content)
 
+        # positions outside every sublist are left out of the computation and left unset in the result
+        if good is not None and good.all():
+            good = None
+
         for i in range(len(inputs)):
             if isinstance(inputs[i], JaggedArray):
                 if good is None:
@@ -401,14 +809,519 @@ class JaggedArray(awkward.array.base.AwkwardArray):
 
         result = getattr(ufunc, method)(*inputs, **kwargs)
 
+        def wrap(x):
+            if good is not None:
+                content = numpy.empty((len(good),) + x.shape[1:], dtype=x.dtype)
+                content[good] = x
+                x = content
+            out = JaggedArray(starts, stops, x)
+            out._derived = jaggedarray._derived     # same starts and stops: share offsets, counts, and parents
+            return out
+
         if isinstance(result, tuple):
-            return tuple(JaggedArray(starts, stops, x) for x in result)
+            return tuple(wrap(x) for x in result)
         elif method == "at":
             return None
         else:
-            return JaggedArray(starts, stops, result)
+            return wrap(result)
         
 
+    @staticmethod
+    def _identity(ufunc, dtype):
+        if ufunc is numpy.minimum or ufunc is numpy.maximum:
+            if issubclass(dtype.type, numpy.bool_):
+                return ufunc is numpy.minimum
+            elif issubclass(dtype.type, numpy.integer):
+                info = numpy.iinfo(dtype)
+                return info.max if ufunc is numpy.minimum else info.min
+            else:
+                return numpy.inf if ufunc is numpy.minimum else -numpy.inf
+        else:
+            return ufunc.identity
+
+    def _reduce(self, ufunc, identity, dtype=None):
+        content = self._content
+        starts = self._starts
+        stops = self._stops[:len(starts)]
+        nonempty = (stops > starts)
+
+        pieces = []
+        if nonempty.any():
+            try:
+                offsets = self._offsets()
+            except ValueError:
+                offsets = None
+
+            if offsets is not None:
+                # contiguous: each nonempty sublist runs exactly to the start of the next nonempty one
+                pieces.append((nonempty, ufunc.reduceat(content[:offsets[-1]], starts[nonempty], axis=0, dtype=dtype)))
+
+            else:
+                which = numpy.nonzero(nonempty)[0]
+                atend = (stops[which] == len(content))
+
+                # reduceat over interleaved starts and stops; every second result is a [start, stop) sublist.
+                # In order of start, the discarded [stop, next start) results cover disjoint gaps (or are single
+                # elements where sublists overlap), so the total work is linear in the content.
+                inner = which[~atend]
+                inner = inner[numpy.argsort(starts[inner], kind="mergesort")]
+                if len(inner) != 0:
+                    indices = numpy.empty(2*len(inner), dtype=self.INDEXTYPE)
+                    indices[0::2] = starts[inner]
+                    indices[1::2] = stops[inner]
+                    pieces.append((inner, ufunc.reduceat(content, indices, axis=0, dtype=dtype)[0::2]))
+
+                # reduceat cannot stop at len(content): reduce between sorted unique starts and accumulate backward
+                outer = which[atend]
+                if len(outer) != 0:
+                    uniques, inverse = numpy.unique(starts[outer], return_inverse=True)
+                    tails = ufunc.reduceat(content, uniques, axis=0, dtype=dtype)
+                    pieces.append((outer, ufunc.accumulate(tails[::-1], axis=0, dtype=dtype)[::-1][inverse]))
+
+        if len(pieces) == 0:
+            if ufunc.identity is None:
+                outdtype = content.dtype if dtype is None else numpy.dtype(dtype)
+            else:
+                outdtype = ufunc.reduce(content[:0], axis=0, dtype=dtype).dtype
+        else:
+            outdtype = pieces[0][1].dtype
+
+        if not nonempty.all():
+            if identity is None:
+                raise ValueError("cannot reduce empty sublists with {0}, which has no identity".format(ufunc.__name__))
+            out = numpy.full((len(starts),) + content.shape[1:], identity, dtype=outdtype)
+        else:
+            out = numpy.empty((len(starts),) + content.shape[1:], dtype=outdtype)
+
+        for where, result in pieces:
+            out[where] = result
+        return out
+
+    def _accumulate(self, ufunc, dtype=None, promote=False):
+        counts = self._counts()
+        try:
+            offsets = self._offsets() if len(self._starts) != 0 else None
+        except ValueError:
+            offsets = None
+
+        if offsets is not None:
+            # contiguous: scan the content in place of the sublists and keep starts/stops
+            start = offsets[0]
+            values = self._content[start:offsets[-1]]
+            offsets = offsets - start
+        else:
+            start = None
+            offsets = self.counts2offsets(counts)
+            values = self._content[self._contentindex(self._starts, counts)]
+
+        if dtype is None and promote:
+            # as in numpy.cumsum and sum(), bool and small integers accumulate in the default integer type
+            dtype = ufunc.reduce(values[:0], axis=0).dtype
+
+        parents = self.offsets2parents(offsets)
+        nonempty = (counts > 0)
+        firsts = offsets[:-1][nonempty]
+
+        if ufunc is numpy.add and issubclass(numpy.dtype(values.dtype if dtype is None else dtype).type, numpy.integer):
+            # one global accumulate, then subtract what the previous sublists contributed (exact only for integers)
+            out = ufunc.accumulate(values, axis=0, dtype=dtype)
+            if len(out) != 0:
+                before = numpy.zeros((len(counts),) + out.shape[1:], dtype=out.dtype)
+                before[nonempty] = out[firsts - 1]
+                before[nonempty & (offsets[:-1] == 0)] = 0
+                out -= before[parents]
+
+        elif ufunc is numpy.add or ufunc is numpy.multiply:
+            # floating point: regrouping changes the rounding, so accumulate each sublist left to right (as
+            # numpy.cumsum does) along the rows of a padded 2-d array; the padding comes after each sublist.
+            # Sublists longer than 4 times the mean would make the padded array too large: there are fewer
+            # than len(content)/cap of them, and each is accumulated directly as a slice.
+            local = numpy.arange(len(values), dtype=self.INDEXTYPE) - offsets[:-1][parents]
+            cap = max(1, 4 * len(values) // max(1, len(counts)))
+            short = (counts <= cap)
+            outdtype = values.dtype if dtype is None else dtype
+
+            if short.all():
+                padded = numpy.zeros((len(counts), counts.max() if len(counts) != 0 else 0) + values.shape[1:], dtype=outdtype)
+                padded[parents, local] = values
+                ufunc.accumulate(padded, axis=1, out=padded)
+                out = padded[parents, local]
+
+            else:
+                isshort = short[parents]
+                rows = (numpy.cumsum(short) - 1)[parents[isshort]]
+                local = local[isshort]
+                out = numpy.empty(values.shape, dtype=outdtype)
+                padded = numpy.zeros((numpy.count_nonzero(short), counts[short].max() if short.any() else 0) + values.shape[1:], dtype=outdtype)
+                padded[rows, local] = values[isshort]
+                ufunc.accumulate(padded, axis=1, out=padded)
+                out[isshort] = padded[rows, local]
+
+            for i in numpy.nonzero(~short)[0]:
+                out[offsets[i]:offsets[i + 1]] = ufunc.accumulate(values[offsets[i]:offsets[i + 1]], axis=0, dtype=out.dtype)
+
+        else:
+            # segmented scan by doubling (no inverse needed): log2(longest sublist) passes over the content
+            out = numpy.array(values, dtype=dtype)
+            local = numpy.arange(len(out), dtype=self.INDEXTYPE) - offsets[:-1][parents]
+            distance = 1
+            while len(counts) != 0 and distance < counts.max():
+                index = numpy.nonzero(local >= distance)[0]
+                out[index] = ufunc(out[index - distance], out[index])
+                distance *= 2
+
+        if start is None:
+            return JaggedArray.fromoffsets(offsets, out, writeable=self._writeable)
+        else:
+            content = numpy.empty((len(self._content),) + out.shape[1:], dtype=out.dtype)
+            content[start:start + len(out)] = out
+            return JaggedArray(self._starts, self._stops, content, writeable=self._writeable)
+
+    def cumsum(self):
+        return self._accumulate(numpy.add, promote=True)
+
+    def cumprod(self):
+        return self._accumulate(numpy.multiply, promote=True)
+
+    def sum(self):
+        return self._reduce(numpy.add, 0)
+
+    def prod(self):
+        return self._reduce(numpy.multiply, 1)
+
+    def min(self):
+        return self._reduce(numpy.minimum, self._identity(numpy.minimum, self._content.dtype))
+
+    def max(self):
+        return self._reduce(numpy.maximum, self._identity(numpy.maximum, self._content.dtype))
+
+    def any(self):
+        return self._reduce(numpy.logical_or, False)
+
+    def all(self):
+        return self._reduce(numpy.logical_and, True)
+
+    def count_nonzero(self):
+        return JaggedArray(self._starts, self._stops, self._content != 0)._reduce(numpy.add, 0, dtype=self.INDEXTYPE)
+
+    def _argminmax(self, ismax):
+        # returns a mask of nonempty sublists and the content index of the first extreme value in each of them
+        nonempty = (self._counts() != 0)
+        if len(self._starts) == 0 or not nonempty.any():
+            return nonempty, numpy.empty(0, dtype=self.INDEXTYPE)
+
+        try:
+            self._offsets()
+        except ValueError:
+            # sublists may overlap, but each content position has only one parent: find the extremes in
+            # a compacted copy, in which every element has its own position, and map them back
+            counts = self._counts()
+            index = self._contentindex(self._starts, counts)
+            nonempty, best = JaggedArray.fromcounts(counts, self._content[index])._argminmax(ismax)
+            return nonempty, index[best]
+
+        extreme = self.max() if ismax else self.min()
+        parents = self._parents()
+        isextreme = (self._content == extreme[parents])
+        if issubclass(self._content.dtype.type, numpy.floating):
+            # like numpy.argmax, a NaN is the extreme value of any sublist that contains one
+            isextreme |= numpy.isnan(self._content) & numpy.isnan(extreme)[parents]
+
+        length = len(self._content)
+        candidates = numpy.where(isextreme, numpy.arange(length, dtype=self.INDEXTYPE), length)
+        best = JaggedArray(self._starts, self._stops, candidates)._reduce(numpy.minimum, length)
+        return nonempty, best[nonempty]
+
+    def argmax(self):
+        nonempty, best = self._argminmax(True)
+        return JaggedArray.fromcounts(nonempty.astype(self.INDEXTYPE), best - self._starts[nonempty])
+
+    def argmin(self):
+        nonempty, best = self._argminmax(False)
+        return JaggedArray.fromcounts(nonempty.astype(self.INDEXTYPE), best - self._starts[nonempty])
+
+    def _selectby(self, other, ismax):
+        if not isinstance(other, JaggedArray):
+            raise TypeError("selection key must be a JaggedArray")
+        if isinstance(other, ByteJaggedArray):
+            other = other.tojagged(copy=False)
+        if len(self) != len(other) or not numpy.array_equal(self._counts(), other._counts()):
+            raise ValueError("selection key must have the same number of elements in each sublist")
+        nonempty, best = other._argminmax(ismax)
+        best = best - other._starts[nonempty] + self._starts[nonempty]
+        return JaggedArray.fromcounts(nonempty.astype(self.INDEXTYPE), self._content[best], writeable=self._writeable)
+
+    def maxby(self, other):
+        return self._selectby(other, True)
+
+    def minby(self, other):
+        return self._selectby(other, False)
+
+    def _argsortindex(self, ascending):
+        # one lexsort over the whole content with parents as the primary key keeps every sublist in place
+        counts = self._counts()
+        offsets = self.counts2offsets(counts)
+        parents = self.offsets2parents(offsets)
+        index = self._contentindex(self._starts, counts)
+        values = self._content[index]
+
+        if ascending:
+            order = numpy.lexsort((values, parents))
+        else:
+            # stable descending sort: ascending sort of the reversed array, reversed back
+            order = numpy.lexsort((values[::-1], -parents[::-1]))[::-1]
+            order = len(order) - 1 - order
+
+        return offsets, parents, index[order], order - offsets[:-1][parents]
+
+    def argsort(self, ascending=True):
+        offsets, parents, index, local = self._argsortindex(ascending)
+        return JaggedArray.fromoffsets(offsets, local, writeable=self._writeable)
+
+    def sort(self, ascending=True):
+        offsets, parents, index, local = self._argsortindex(ascending)
+        return JaggedArray.fromoffsets(offsets, self._content[index], writeable=self._writeable)
+
+    def _uniquemask(self):
+        # sorted within sublists, a value is new if it differs from its predecessor or starts a sublist
+        offsets, parents, index, local = self._argsortindex(True)
+        values = self._content[index]
+        isnew = numpy.ones(len(values), dtype=numpy.bool_)
+        isnew[1:] = (parents[1:] != parents[:-1]) | (values[1:] != values[:-1])
+        return offsets, parents, values, isnew
+
+    def unique(self, return_counts=False):
+        offsets, parents, values, isnew = self._uniquemask()
+        newcounts = numpy.bincount(parents[isnew], minlength=len(self._starts)).astype(self.INDEXTYPE)
+        out = JaggedArray.fromcounts(newcounts, values[isnew], writeable=self._writeable)
+        if return_counts:
+            # multiplicity of each unique value: distance between consecutive run starts
+            starts = numpy.append(numpy.nonzero(isnew)[0], len(values))
+            return out, JaggedArray.fromcounts(newcounts, (starts[1:] - starts[:-1]).astype(self.INDEXTYPE))
+        else:
+            return out
+
+    def count_unique(self):
+        offsets, parents, values, isnew = self._uniquemask()
+        return numpy.bincount(parents[isnew], minlength=len(self._starts)).astype(self.INDEXTYPE)
+
+    def searchsorted(self, values, side="left"):
+        '''
+        Like numpy.searchsorted within each sublist, which must already be sorted. `values` is a JaggedArray with the same number of sublists (returns a JaggedArray of local indices), one value per sublist, or a single value for all of them (both return an ndarray).
+        '''
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right'")
+        if isinstance(values, JaggedArray):
+            if isinstance(values, ByteJaggedArray):
+                values = values.tojagged(copy=False)
+            if len(values) != len(self._starts):
+                raise ValueError("values must have the same number of sublists as the array")
+            queryoffsets = self.counts2offsets(values._counts())
+            queryparents = self.offsets2parents(queryoffsets)
+            queries = values._content[self._contentindex(values._starts, values._counts())]
+        else:
+            queryoffsets = None
+            queryparents = numpy.arange(len(self._starts), dtype=self.INDEXTYPE)
+            queries = numpy.broadcast_to(values, (len(self._starts),))
+
+        # bisect every query's sublist at once, in place in the content: each pass halves the [low, high)
+        # range of the queries that are not yet done, so there are about log2(longest sublist) passes
+        low = self._starts[queryparents].astype(self.INDEXTYPE)
+        high = self._stops[:len(self._starts)][queryparents].astype(self.INDEXTYPE)
+        first = low.copy()
+        isfloat = issubclass(self._content.dtype.type, numpy.floating)
+        active = numpy.nonzero(low < high)[0]
+        while len(active) != 0:
+            mid = (low[active] + high[active]) // 2
+            x, q = self._content[mid], queries[active]
+            if side == "left":
+                before = (x < q)
+                if isfloat:
+                    # as in numpy.searchsorted, NaN sorts after everything else
+                    before |= numpy.isnan(q) & ~numpy.isnan(x)
+            else:
+                before = ~(q < x)
+                if isfloat:
+                    before &= ~(numpy.isnan(x) & ~numpy.isnan(q))
+            low[active[before]] = mid[before] + 1
+            high[active[~before]] = mid[~before]
+            active = active[low[active] < high[active]]
+        local = low - first
+
+        if queryoffsets is None:
+            return local
+        else:
+            return JaggedArray.fromoffsets(queryoffsets, local, writeable=self._writeable)
+
+    @staticmethod
+    def _histogramedges(bins, range, values):
+        if isinstance(bins, (numbers.Integral, numpy.integer)):
+            if range is None:
+                range = (values.min(), values.max()) if len(values) != 0 else (0.0, 1.0)
+            low, high = range
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            return numpy.linspace(low, high, bins + 1)
+        else:
+            edges = numpy.asarray(bins)
+            if len(edges.shape) != 1 or len(edges) < 2 or (edges[1:] < edges[:-1]).any():
+                raise ValueError("bins must be an integer or a monotonically increasing array of edges")
+            return edges
+
+    # number of content elements whose per-event weights histogram gathers at a time
+    HISTOGRAM_BLOCK = 65536
+
+    def histogram(self, bins, weights=None, per_event_weights=None, range=None):
+        '''
+        Like numpy.histogram of all elements of all sublists; returns (histogram, edges). `weights` is a JaggedArray with the same counts, `per_event_weights` has one weight per sublist; both may be given (they multiply).
+        '''
+        counts = self._counts()
+        values = self.flatten()
+        edges = self._histogramedges(bins, range, values)
+        numbins = len(edges) - 1
+
+        # bins are [low, high) except the last, which includes its upper edge, as in numpy.histogram
+        index = numpy.searchsorted(edges, values, side="right") - 1
+        index[values == edges[-1]] = numbins - 1
+        good = (index >= 0) & (index < numbins)
+
+        w = None
+        if weights is not None:
+            if not isinstance(weights, JaggedArray):
+                raise TypeError("weights must be a JaggedArray")
+            if isinstance(weights, ByteJaggedArray):
+                weights = weights.tojagged(copy=False)
+            if len(weights) != len(self._starts) or not numpy.array_equal(weights._counts(), counts):
+                raise ValueError("weights must have the same number of elements in each sublist")
+            w = weights.flatten()
+        if per_event_weights is not None:
+            per_event_weights = numpy.asarray(per_event_weights)
+            if per_event_weights.shape != (len(self._starts),):
+                raise ValueError("per_event_weights must have one weight per sublist")
+
+        if per_event_weights is None and w is None:
+            out = numpy.bincount(index[good], minlength=numbins)
+        elif per_event_weights is None:
+            out = numpy.bincount(index[good], weights=w[good], minlength=numbins)
+        else:
+            # per-event weights are gathered by parent one block of content at a time, so that no
+            # content-length weight array is made; a block's parents come from the offsets that overlap it
+            offsets = self.counts2offsets(counts)
+            out = numpy.zeros(numbins, dtype=numpy.float64)
+            start = 0
+            while start < len(values):
+                stop = min(start + self.HISTOGRAM_BLOCK, len(values))
+                first = numpy.searchsorted(offsets, start, side="right") - 1
+                last = numpy.searchsorted(offsets, stop, side="left")
+                parents = self.offsets2parents(numpy.clip(offsets[first:last + 1], start, stop) - start) + first
+                blockgood = good[start:stop]
+                blockweights = per_event_weights[parents[blockgood]]
+                if w is not None:
+                    blockweights = blockweights * w[start:stop][blockgood]
+                out += numpy.bincount(index[start:stop][blockgood], weights=blockweights, minlength=numbins)
+                start = stop
+        return out, edges
+
+    # beyond this many rounds of segmented argmax, one sort of the whole content is cheaper
+    # (see bench_topk in benchmarks/bench_jagged.py)
+    TOPK_MAXROUNDS = 12
+
+    def _argtopkindex(self, k, by):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if by is None:
+            by = self
+        elif not isinstance(by, JaggedArray):
+            raise TypeError("selection key must be a JaggedArray")
+        if isinstance(by, ByteJaggedArray):
+            by = by.tojagged(copy=False)
+        if len(self) != len(by) or not numpy.array_equal(self._counts(), by._counts()):
+            raise ValueError("selection key must have the same number of elements in each sublist")
+
+        counts = self._counts()
+        newcounts = numpy.minimum(counts, k)
+        newoffsets = self.counts2offsets(newcounts)
+        rounds = newcounts.max() if len(newcounts) != 0 else 0
+
+        if rounds > self.TOPK_MAXROUNDS:
+            # one stable descending sort within sublists (NaN first, ties in order), keeping the first k of each
+            offsets, parents, index, local = by._argsortindex(False)
+            return newoffsets, local[(numpy.arange(len(local), dtype=self.INDEXTYPE) - offsets[:-1][parents]) < k]
+
+        # min(k, longest sublist) rounds of a segmented argmax over the elements not yet taken, no sorting
+        offsets = self.counts2offsets(counts)
+        parents = self.offsets2parents(offsets)
+        values = by._content[self._contentindex(by._starts, counts)]
+        out = numpy.empty(newoffsets[-1], dtype=self.INDEXTYPE)
+
+        length = len(values)
+        positions = numpy.arange(length, dtype=self.INDEXTYPE)
+        alive = numpy.ones(length, dtype=numpy.bool_)
+        identity = self._identity(numpy.maximum, values.dtype)
+        isfloat = issubclass(values.dtype.type, numpy.floating)
+
+        for i in range(rounds):
+            masked = numpy.where(alive, values, identity)
+            extreme = JaggedArray.fromoffsets(offsets, masked)._reduce(numpy.maximum, identity)
+            isbest = (masked == extreme[parents])
+            if isfloat:
+                # like argmax, NaN ranks above everything else
+                isbest |= numpy.isnan(masked) & numpy.isnan(extreme)[parents]
+            isbest &= alive
+
+            best = JaggedArray.fromoffsets(offsets, numpy.where(isbest, positions, length))._reduce(numpy.minimum, length)
+            best = best[newcounts > i]
+            alive[best] = False
+            out[newoffsets[:-1][newcounts > i] + i] = best
+
+        return newoffsets, out - offsets[:-1][parents[out]]
+
+    def argtopk(self, k, by=None):
+        '''
+        Local indices of the (at most) k largest elements of each sublist, largest first, ranked by `by` (a JaggedArray with the same counts) or by the content itself.
+        '''
+        newoffsets, local = self._argtopkindex(k, by)
+        return JaggedArray.fromoffsets(newoffsets, local, writeable=self._writeable)
+
+    def topk(self, k, by=None):
+        '''
+        The (at most) k largest elements of each sublist, largest first, ranked by `by` (a JaggedArray with the same counts) or by the content itself.
+        '''
+        newoffsets, local = self._argtopkindex(k, by)
+        parents = self.offsets2parents(newoffsets)
+        return JaggedArray.fromoffsets(newoffsets, self._content[self._starts[parents] + local], writeable=self._writeable)
+
+    def _argproductindex(self, other, start, stop):
+        # integer-only pair generator for events [start, stop): pair k of an event with n2 right-hand
+        # elements is (k // n2, k % n2), and events with no pairs contribute no entries at all
+        starts1, starts2 = self._starts[start:stop], other._starts[start:stop]
+        counts2 = other._stops[start:stop] - starts2
+        offsets = self.counts2offsets((self._stops[start:stop] - starts1) * counts2)
+
+        parents = self.offsets2parents(offsets)
+        local = numpy.arange(offsets[-1], dtype=self.INDEXTYPE)
+        local -= offsets[:-1][parents]
+
+        if hasattr(numpy, "divmod"):
+            left, right = numpy.divmod(local, counts2[parents])
+        else:
+            n2 = counts2[parents]
+            left = numpy.floor_divide(local, n2)
+            right = local - left*n2
+
+        left += starts1[parents]
+        right += starts2[parents]
+        return offsets, left, right
+
+    def _checkproduct(self, other):
+        if not isinstance(other, JaggedArray):
+            raise ValueError("array given isn't instance of JaggedArray; need JaggedArrays to proceed")
+        if len(self._starts) != len(other):
+            raise ValueError("Number of events in each array must be equal")
+        if isinstance(other, ByteJaggedArray):
+            other = other.tojagged(copy=False)
+        return other
+
     def argproduct(self, other):
         '''
         Performs product (combinations) of current JaggedArray with JaggedArray `other`. Return the indices of the product.
@@ -421,46 +1334,11 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         >>> arr2 = JaggedArray([0,1,1,4],[1,1,4,5],content=['z', 'a','b','c','d'])
         >>> result = arr1.argproduct(arr2)
         '''
-        import awkward.array.table 
-        if not isinstance(other, JaggedArray):
-            raise ValueError("array given isn't instance of JaggedArray; need JaggedArrays to proceed")
-        
-        if (len(self._starts) != len(other)):
-            raise ValueError("Number of events in each array must be equal")
-        
-        starts1 = self._starts
-        stops1 = self._stops
-        counts1 = stops1 - starts1
-
-        starts2 = other.starts
-        stops2 = other.stops
-        counts2 = stops2 - starts2
-        
-
-        pairs_counts = numpy.zeros(len(starts1)+1, dtype=self.INDEXTYPE)
-        pairs_counts[1:] = numpy.cumsum(counts1*counts2, dtype=self.INDEXTYPE)
-
-        def parents_from_offsets(offsets):
-            out = numpy.full(offsets[-1], -1, dtype=self.INDEXTYPE)
-            lenstarts = len(offsets)-1
-            i = 0
-            while i < lenstarts:
-                out[offsets[i]:offsets[i+1]] = i
-                i += 1
-            return out
-        
-        pairs_indices = numpy.arange(pairs_counts[-1], dtype=self.INDEXTYPE)
-        pairs_parents = parents_from_offsets(pairs_counts)
-        pairs_parents = pairs_parents.astype(self.INDEXTYPE)
-
-        left = numpy.empty_like(pairs_indices)
-        right = numpy.empty_like(pairs_indices)
-
-        left[pairs_indices] = starts1[pairs_parents[pairs_indices]] + numpy.floor((pairs_indices - pairs_counts[pairs_parents[pairs_indices]])/counts2[pairs_parents[pairs_indices]]).astype(self.INDEXTYPE)
-        right[pairs_indices] = starts2[pairs_parents[pairs_indices]] + (pairs_indices - pairs_counts[pairs_parents[pairs_indices]]) - counts2[pairs_parents[pairs_indices]] * numpy.floor((pairs_indices - pairs_counts[pairs_parents[pairs_indices]])/counts2[pairs_parents[pairs_indices]])
+        import awkward.array.table
+        other = self._checkproduct(other)
+        offsets, left, right = self._argproductindex(other, 0, len(self._starts))
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(len(left), left, right), writeable=self._writeable)
 
-        return JaggedArray(pairs_counts[:-1], pairs_counts[1:], awkward.array.table.Table(pairs_indices[-1], left, right), writeable=self._writeable)
-    
     def product(self, other):
         '''
         Performs product ( combinations) between two JaggedArrays and returns the resulting combined content as a JaggedArray()
@@ -474,11 +1352,128 @@ class JaggedArray(awkward.array.base.AwkwardArray):
         >>> result = arr1.product(arr2)
         '''
         import awkward.array.table
-        product_indexes = self.argproduct(other)
-        arr_list = list(product_indexes._content._content.values())
-        return JaggedArray(product_indexes.starts, product_indexes.stops, awkward.array.table.Table(len(arr_list[0]), self._content[arr_list[0]], other.content[arr_list[1]]))
+        other = self._checkproduct(other)
+        offsets, left, right = self._argproductindex(other, 0, len(self._starts))
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(len(left), self._content[left], other._content[right]))
+
+    def _argcrossindex(self, others):
+        # integer-only n-way generator: tuple k of an event is k written in the mixed radix of the
+        # arrays' counts, with the last array varying fastest (the same order as argproduct)
+        arrays = [self] + [self._checkproduct(x) for x in others]
+        counts = [x._counts() for x in arrays]
+
+        numtuples = numpy.ones(len(self._starts), dtype=self.INDEXTYPE)
+        for x in counts:
+            numtuples *= x
+        offsets = self.counts2offsets(numtuples)
+
+        parents = self.offsets2parents(offsets)
+        local = numpy.arange(offsets[-1], dtype=self.INDEXTYPE)
+        local -= offsets[:-1][parents]
+
+        columns = []
+        for array, count in reversed(list(zip(arrays, counts))):
+            n = count[parents]
+            quotient = numpy.floor_divide(local, n)
+            local -= quotient*n
+            local += array._starts[parents]
+            columns.insert(0, local)
+            local = quotient
+
+        return offsets, arrays, columns
+
+    def argcross(self, *others):
+        '''
+        N-way generalization of argproduct: every combination of one element from this JaggedArray and one from each of `others`, per event, as a JaggedArray of Table rows of indices into the contents (f0 for this array, f1 for the first of `others`, etc.).
+        '''
+        import awkward.array.table
+        offsets, arrays, columns = self._argcrossindex(others)
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(offsets[-1], *columns), writeable=self._writeable)
 
+    def cross(self, *others):
+        '''
+        N-way generalization of product. The Table's columns are IndexedArrays into the original contents, so no content is copied until a column is read.
+        '''
+        import awkward.array.indexed
+        import awkward.array.table
+        offsets, arrays, columns = self._argcrossindex(others)
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(offsets[-1], *[awkward.array.indexed.IndexedArray(x, array._content, writeable=array._writeable) for array, x in zip(arrays, columns)]))
+
+    def _argchooseindex(self, n):
+        # integer-only generator of n-element combinations (increasing local positions) within each sublist
+        if n < 1:
+            raise ValueError("number of elements to choose must be at least 1")
+
+        counts = self._counts()
+        offsets = self.counts2offsets(counts)
+        parents = self.offsets2parents(offsets)
+        columns = [numpy.arange(offsets[-1], dtype=self.INDEXTYPE) - offsets[:-1][parents]]
+
+        for i in range(1, n):
+            # extend each combination by every element after its last one
+            tupleoffsets = self.counts2offsets(counts[parents] - 1 - columns[-1])
+            tupleparents = self.offsets2parents(tupleoffsets)
+            last = numpy.arange(tupleoffsets[-1], dtype=self.INDEXTYPE) - tupleoffsets[:-1][tupleparents]
+            last += columns[-1][tupleparents] + 1
+            columns = [x[tupleparents] for x in columns] + [last]
+            parents = parents[tupleparents]
+
+        # number of combinations per sublist, exact in integers: c*(c-1)*...*(c-n+1)/n!
+        numcombinations = numpy.ones(len(counts), dtype=self.INDEXTYPE)
+        for i in range(n):
+            numcombinations *= counts - i
+            numcombinations //= i + 1
+
+        starts = self._starts[parents]
+        return self.counts2offsets(numcombinations), [starts + x for x in columns]
+
+    def argchoose(self, n):
+        import awkward.array.table
+        offsets, columns = self._argchooseindex(n)
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(offsets[-1], *columns), writeable=self._writeable)
 
+    def choose(self, n):
+        import awkward.array.table
+        offsets, columns = self._argchooseindex(n)
+        return JaggedArray.fromoffsets(offsets, awkward.array.table.Table(offsets[-1], *[self._content[x] for x in columns]))
+
+    def argpairs(self):
+        return self.argchoose(2)
+
+    def pairs(self):
+        return self.choose(2)
+
+    def _productchunks(self, other, maxpairs):
+        if maxpairs < 1:
+            raise ValueError("maxpairs must be at least 1")
+        other = self._checkproduct(other)
+        offsets = self.counts2offsets(self._counts() * other._counts())
+
+        # greedily group consecutive events so that each group has at most maxpairs pairs (or is a single event)
+        start = 0
+        while start < len(self._starts):
+            stop = numpy.searchsorted(offsets, offsets[start] + maxpairs, side="right") - 1
+            stop = max(stop, start + 1)
+            yield other, start, stop
+            start = stop
+
+    def argproductchunks(self, other, maxpairs):
+        '''
+        Like argproduct, but yields JaggedArrays for consecutive groups of events, each with at most `maxpairs` pairs (unless a single event has more), so that the pair indices of all events are never in memory at once. Indices refer to the full contents, as in argproduct.
+        '''
+        import awkward.array.table
+        for other, start, stop in self._productchunks(other, maxpairs):
+            offsets, left, right = self._argproductindex(other, start, stop)
+            yield JaggedArray.fromoffsets(offsets, awkward.array.table.Table(len(left), left, right), writeable=self._writeable)
+
+    def productchunks(self, other, maxpairs):
+        '''
+        Like product, but yields JaggedArrays for consecutive groups of events, each with at most `maxpairs` pairs (unless a single event has more).
+        '''
+        import awkward.array.table
+        for other, start, stop in self._productchunks(other, maxpairs):
+            offsets, left, right = self._argproductindex(other, start, stop)
+            yield JaggedArray.fromoffsets(offsets, awkward.array.table.Table(len(left), self._content[left], other._content[right]))
 
 class ByteJaggedArray(JaggedArray):
     @classmethod
@@ -530,7 +1525,10 @@ class ByteJaggedArray(JaggedArray):
 
     def __getitem__(self, where):
         if self._isstring(where):
-            return ByteJaggedArray(self._starts, self._stops, self._content[where], self._dtype, writeable=writeable)
+            return ByteJaggedArray(self._starts, self._stops, self._content[where], self._dtype, writeable=self._writeable)
+
+        if isinstance(where, JaggedArray) or (isinstance(where, tuple) and len(where) > 1):
+            return self.tojagged(copy=False)[where]
 
         self._check_startsstops()
         starts = self._starts[where]
@@ -543,7 +1541,7 @@ class ByteJaggedArray(JaggedArray):
 
     def __setitem__(self, where, what):
         if self._isstring(where):
-            ByteJaggedArray(self._starts, self._stops, self._content[where], self._dtype, writeable=writeable)[:] = what
+            ByteJaggedArray(self._starts, self._stops, self._content[where], self._dtype, writeable=self._writeable)[:] = what
             return
 
         if not self._writeable:
@@ -560,48 +1558,44 @@ class ByteJaggedArray(JaggedArray):
             buf[startpos:stoppos] = what
 
         elif len(starts) != 0:
-            if hasattr(numpy, "divmod"):
-                startposes, offsets = numpy.divmod(starts, self._dtype.itemsize)
+            # fill a typed buffer for all selected sublists (with JaggedArray's broadcasting rules), then scatter it once
+            itemsize = self._dtype.itemsize
+            counts = (stops - starts) // itemsize
+            hold = numpy.empty(counts.sum(), dtype=self._dtype)
+            if isinstance(what, ByteJaggedArray):
+                what = what.tojagged(copy=False)
+            JaggedArray.fromcounts(counts, hold)[:] = what
+
+            nonempty = (counts > 0)
+            if (starts[nonempty] % itemsize == 0).all():
+                # aligned: scatter whole items through a typed view of the bytes
+                view = self._content[:len(self._content) - len(self._content) % itemsize].view(self._dtype)
+                view[self._contentindex(starts // itemsize, counts)] = hold
             else:
-                startposes = numpy.floor_divide(starts, self._dtype.itemsize)
-                offsets = numpy.remainder(starts, self._dtype.itemsize)
-
-            stopposes = numpy.floor_divide(stops, self._dtype.itemsize)
-
-            if isinstance(what, JaggedArray):
-                if len(what) != len(startposes):
-                    raise ValueError("cannot copy JaggedArray with length {0} to ByteJaggedArray with dimension {1}".format(len(what), len(startposes)))
-                for which, startpos, stoppos, offset in awkward.util.izip(what, startposes, stopposes, offsets):
-                    buf = numpy.frombuffer(self._content, dtype=self._dtype, count=stoppos, offset=offset)
-                    buf[startpos:stoppos] = which
-
-            elif isinstance(what, (collections.Sequence, numpy.ndarray, awkward.array.base.AwkwardArray)) and len(what) == 1:
-                for startpos, stoppos, offset in awkward.util.izip(startposes, stopposes, offsets):
-                    buf = numpy.frombuffer(self._content, dtype=self._dtype, count=stoppos, offset=offset)
-                    buf[startpos:stoppos] = what[0]
-
-            elif isinstance(what, (collections.Sequence, numpy.ndarray, awkward.array.base.AwkwardArray)):
-                if len(what) != (stopposes - startposes).sum():
-                    raise ValueError("cannot copy sequence with length {0} to ByteJaggedArray with dimension {1}".format(len(what), (stopposes - startposes).sum()))
-                this = next = 0
-                for startpos, stoppos, offset in awkward.util.izip(startposes, stopposes, offsets):
-                    next += stoppos - startpos
-                    buf = numpy.frombuffer(self._content, dtype=self._dtype, count=stoppos, offset=offset)
-                    buf[startpos:stoppos] = what[this:next]
-                    this = next
+                self._content[self._contentindex(starts, counts * itemsize)] = hold.view(self.CHARTYPE)
 
-            else:
-                for startpos, stoppos, offset in awkward.util.izip(startposes, stopposes, offsets):
-                    buf = numpy.frombuffer(self._content, dtype=self._dtype, count=stoppos, offset=offset)
-                    buf[startpos:stoppos] = what
+    def _isaligned(self):
+        # true if every sublist starts and stops on an item boundary, so the bytes can be viewed as dtype
+        itemsize = self._dtype.itemsize
+        starts = self._starts
+        stops = self._stops[:len(starts)]
+        nonempty = (stops > starts)
+        return bool((starts[nonempty] % itemsize == 0).all() and (stops[nonempty] % itemsize == 0).all())
 
     def tojagged(self, starts=None, stops=None, copy=True, writeable=True):
-        counts = self.counts
+        counts = self._counts() // self._dtype.itemsize
+
+        if starts is None and stops is None and self._isaligned():
+            # zero-copy: reinterpret the whole byte buffer and divide starts/stops by the itemsize
+            itemsize = self._dtype.itemsize
+            content = self._content[:len(self._content) - len(self._content) % itemsize].view(self._dtype)
+            if copy:
+                content = content.copy()
+            starts = self._starts // itemsize
+            return JaggedArray(starts, starts + counts, content, writeable=writeable)
 
         if starts is None and stops is None:
-            offsets = numpy.empty(len(self) + 1, dtype=self.INDEXTYPE)
-            offsets[0] = 0
-            numpy.cumsum(counts // self.dtype.itemsize, out=offsets[1:])
+            offsets = self.counts2offsets(counts)
             starts, stops = offsets[:-1], offsets[1:]
             
         elif stops is None:
@@ -609,7 +1603,7 @@ class ByteJaggedArray(JaggedArray):
             if len(self) != len(starts):
                 raise IndexError("cannot fit ByteJaggedArray of length {0} into starts of length {1}".format(len(self), len(starts)))
 
-            stops = starts + (counts // self.dtype.itemsize)
+            stops = starts + counts
 
             if (stops[:-1] > starts[1:]).any():
                 raise IndexError("cannot fit contents of ByteJaggedArray into the given starts array")
@@ -619,94 +1613,124 @@ class ByteJaggedArray(JaggedArray):
             if len(self) != len(stops):
                 raise IndexError("cannot fit ByteJaggedArray of length {0} into stops of length {1}".format(len(self), len(stops)))
 
-            starts = stops - (counts // self.dtype.itemsize)
+            starts = stops - counts
 
             if (stops[:-1] > starts[1:]).any():
                 raise IndexError("cannot fit contents of ByteJaggedArray into the given stops array")
 
         else:
+            starts = self._toarray(starts, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
+            stops = self._toarray(stops, self.INDEXTYPE, (numpy.ndarray, awkward.array.base.AwkwardArray))
             if not numpy.array_equal(stops - starts, counts):
                 raise IndexError("cannot fit contents of ByteJaggedArray into the given starts and stops arrays")
 
         self._check_startsstops(starts, stops)
 
-        selfstarts, selfstops, selfcontent, selfdtype = self._starts, self._stops, self._content, self._dtype
-        content = numpy.empty(counts.sum() // selfdtype.itemsize, dtype=selfdtype)
+        # gather whole items as bytes, then reinterpret them as dtype
+        itemsize = self._dtype.itemsize
+        selfindex = self._contentindex(self._starts, counts * itemsize)
 
-        lenstarts = len(starts)
-        i = 0
-        while i < lenstarts:
-            content[starts[i]:stops[i]] = selfcontent[selfstarts[i]:selfstops[i]].view(selfdtype)
-            i += 1
+        if self._isoffsets(starts, stops):
+            content = self._content[selfindex].view(self._dtype)
+        else:
+            content = numpy.empty(stops.max() if len(stops) != 0 else 0, dtype=self._dtype)
+            content.view(self.CHARTYPE)[self._contentindex(starts * itemsize, counts * itemsize)] = self._content[selfindex]
 
         return JaggedArray(starts, stops, content, writeable=writeable)
 
-    def argproduct(self, other):
-        '''
-        Performs product (combinations) of current JaggedArray with JaggedArray `other`. Return the indices of the product.
+    def compact(self):
+        if len(self._starts) == 0:
+            return self
 
-        Inputs: other; a JaggedArray instance.
-        Output: JaggedArray containing thw two indices as an awkward.array.table.Table()
+        try:
+            offsets = self._offsets()
+        except ValueError:
+            counts = self._counts()
+            return ByteJaggedArray.fromoffsets(self.counts2offsets(counts), self._content[self._contentindex(self._starts, counts)], self._dtype, writeable=self._writeable)
+        else:
+            if self._offsets_is_aliased():
+                return self
+            else:
+                return ByteJaggedArray.fromoffsets(offsets, self._content, self._dtype, writeable=self._writeable)
 
-        Example usage:
-        >>> arr1 = JaggedArray([0,1,4,4],[1,4,4,8],content=[0,1,2,3,4,5,6,7])
-        >>> arr2 = JaggedArray([0,1,1,4],[1,1,4,5],content=['z', 'a','b','c','d'])
-        >>> result = arr1.argproduct(arr2)
-        '''
-        import awkward.array.table 
-        if not isinstance(other, JaggedArray):
-            raise ValueError("array given isn't instance of JaggedArray; need JaggedArrays to proceed")
-        
-        if (len(self._starts) != len(other)):
-            raise ValueError("Number of events in each array must be equal")
-        
-        starts1 = self._starts
-        stops1 = self._stops
-        counts1 = stops1 - starts1
+    @property
+    def localindex(self):
+        return self.tojagged(copy=False).localindex
 
-        starts2 = other.starts
-        stops2 = other.stops
-        counts2 = stops2 - starts2
-        
+    def _reduce(self, ufunc, identity, dtype=None):
+        return self.tojagged(copy=False)._reduce(ufunc, identity, dtype)
 
-        pairs_counts = numpy.zeros(len(starts1)+1, dtype=self.INDEXTYPE)
-        pairs_counts[1:] = numpy.cumsum(counts1*counts2, dtype=self.INDEXTYPE)
+    def _accumulate(self, ufunc, dtype=None, promote=False):
+        return self.tojagged(copy=False)._accumulate(ufunc, dtype, promote)
 
-        def parents_from_offsets(offsets):
-            out = numpy.full(offsets[-1], -1, dtype=self.INDEXTYPE)
-            lenstarts = len(offsets)-1
-            i = 0
-            while i < lenstarts:
-                out[offsets[i]:offsets[i+1]] = i
-                i += 1
-            return out
-        
-        pairs_indices = numpy.arange(pairs_counts[-1], dtype=self.INDEXTYPE)
-        pairs_parents = parents_from_offsets(pairs_counts)
-        pairs_parents = pairs_parents.astype(self.INDEXTYPE)
+    def min(self):
+        return self.tojagged(copy=False).min()
+
+    def max(self):
+        return self.tojagged(copy=False).max()
+
+    def count_nonzero(self):
+        return self.tojagged(copy=False).count_nonzero()
+
+    def argmax(self):
+        return self.tojagged(copy=False).argmax()
+
+    def argmin(self):
+        return self.tojagged(copy=False).argmin()
+
+    def _selectby(self, other, ismax):
+        return self.tojagged(copy=False)._selectby(other, ismax)
+
+    def argsort(self, ascending=True):
+        return self.tojagged(copy=False).argsort(ascending)
+
+    def sort(self, ascending=True):
+        return self.tojagged(copy=False).sort(ascending)
+
+    def unique(self, return_counts=False):
+        return self.tojagged(copy=False).unique(return_counts)
+
+    def count_unique(self):
+        return self.tojagged(copy=False).count_unique()
+
+    def searchsorted(self, values, side="left"):
+        return self.tojagged(copy=False).searchsorted(values, side)
+
+    def histogram(self, bins, weights=None, per_event_weights=None, range=None):
+        return self.tojagged(copy=False).histogram(bins, weights, per_event_weights, range)
+
+    def argtopk(self, k, by=None):
+        return self.tojagged(copy=False).argtopk(k, by)
+
+    def topk(self, k, by=None):
+        return self.tojagged(copy=False).topk(k, by)
 
-        left = numpy.empty_like(pairs_indices)
-        right = numpy.empty_like(pairs_indices)
+    def flatten(self):
+        return self.tojagged(copy=False).flatten()
 
-        left[pairs_indices] = starts1[pairs_parents[pairs_indices]] + numpy.floor((pairs_indices - pairs_counts[pairs_parents[pairs_indices]])/counts2[pairs_parents[pairs_indices]]).astype(self.INDEXTYPE)
-        right[pairs_indices] = starts2[pairs_parents[pairs_indices]] + (pairs_indices - pairs_counts[pairs_parents[pairs_indices]]) - counts2[pairs_parents[pairs_indices]] * numpy.floor((pairs_indices - pairs_counts[pairs_parents[pairs_indices]])/counts2[pairs_parents[pairs_indices]])
+    def pad(self, n, clip=True, fill=None):
+        return self.tojagged(copy=False).pad(n, clip, fill)
+
+    def argproduct(self, other):
+        return self.tojagged(copy=False).argproduct(other)
 
-        return JaggedArray(pairs_counts[:-1], pairs_counts[1:], awkward.array.table.Table(pairs_indices[-1], left, right), writeable=self._writeable)
-    
     def product(self, other):
-        '''
-        Performs product ( combinations) between two JaggedArrays and returns the resulting combined content as a JaggedArray()
+        return self.tojagged(copy=False).product(other)
 
-        Inputs: other; a JaggedArray instance
-        Output: JaggedArray containing thw two indices as an awkward.array.table.Table()
+    def argproductchunks(self, other, maxpairs):
+        return self.tojagged(copy=False).argproductchunks(other, maxpairs)
 
-        Example usage:
-        >>> arr1 = JaggedArray([0,1,4,4],[1,4,4,8],content=[0,1,2,3,4,5,6,7])
-        >>> arr2 = JaggedArray([0,1,1,4],[1,1,4,5],content=['z', 'a','b','c','d'])
-        >>> result = arr1.product(arr2)
-        '''
-        import awkward.array.table
-        product_indexes = self.argproduct(other)
-        arr_list = list(product_indexes._content._content.values())
+    def productchunks(self, other, maxpairs):
+        return self.tojagged(copy=False).productchunks(other, maxpairs)
+
+    def argchoose(self, n):
+        return self.tojagged(copy=False).argchoose(n)
+
+    def choose(self, n):
+        return self.tojagged(copy=False).choose(n)
+
+    def argcross(self, *others):
+        return self.tojagged(copy=False).argcross(*others)
 
-        return JaggedArray(product_indexes.starts, product_indexes.stops, awkward.array.table.Table(len(arr_list[0]), self._content[arr_list[0]], other.content[arr_list[1]]))
+    def cross(self, *others):
+        return self.tojagged(copy=False).cross(*others)
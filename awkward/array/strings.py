@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import numbers
+
+import numpy
+
+import awkward.array.base
+import awkward.array.jagged
+import awkward.util
+
+class StringArray(awkward.array.base.AwkwardArray):
+    # variable-length strings as a JaggedArray of encoded bytes; encoding=None for bytestrings
+
+    @classmethod
+    def fromoffsets(cls, offsets, content, encoding="utf-8", writeable=True):
+        return cls(offsets[:-1], offsets[1:], content, encoding=encoding, writeable=writeable)
+
+    @classmethod
+    def fromcounts(cls, counts, content, encoding="utf-8", writeable=True):
+        offsets = awkward.array.jagged.JaggedArray.counts2offsets(counts)
+        return cls(offsets[:-1], offsets[1:], content, encoding=encoding, writeable=writeable)
+
+    @classmethod
+    def fromiter(cls, iterable, encoding="utf-8", writeable=True):
+        if encoding is None:
+            encoded = [bytes(x) for x in iterable]
+        else:
+            encoded = [x.encode(encoding) for x in iterable]
+        counts = numpy.array([len(x) for x in encoded], dtype=cls.INDEXTYPE)
+        content = numpy.frombuffer(b"".join(encoded), dtype=cls.CHARTYPE).copy()
+        return cls.fromcounts(counts, content, encoding=encoding, writeable=writeable)
+
+    def __init__(self, starts, stops, content, encoding="utf-8", writeable=True):
+        self._content = awkward.array.jagged.JaggedArray(starts, stops, self._tobytes(content), writeable=writeable)
+        self.encoding = encoding
+
+    def _tobytes(self, value):
+        return self._toarray(value, self.CHARTYPE, numpy.ndarray).view(self.CHARTYPE).reshape(-1)
+
+    @property
+    def starts(self):
+        return self._content.starts
+
+    @starts.setter
+    def starts(self, value):
+        self._content.starts = value
+
+    @property
+    def stops(self):
+        return self._content.stops
+
+    @stops.setter
+    def stops(self, value):
+        self._content.stops = value
+
+    @property
+    def content(self):
+        return self._content.content
+
+    @content.setter
+    def content(self, value):
+        self._content.content = self._tobytes(value)
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    @encoding.setter
+    def encoding(self, value):
+        if value is not None:
+            "".encode(value)     # raises LookupError for unknown encodings
+        self._encoding = value
+
+    @property
+    def writeable(self):
+        return self._content.writeable
+
+    @writeable.setter
+    def writeable(self, value):
+        self._content.writeable = value
+
+    @property
+    def dtype(self):
+        return numpy.dtype(object)   # specifically, str or bytes
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def offsets(self):
+        return self._content.offsets
+
+    @property
+    def counts(self):
+        # number of bytes in each string
+        return self._content.counts
+
+    def __len__(self):
+        return len(self._content)
+
+    def _decode(self, data):
+        return data if self._encoding is None else data.decode(self._encoding)
+
+    def __getitem__(self, where):
+        if isinstance(where, (numbers.Integral, numpy.integer)):
+            return self._decode(self._content[where].tobytes())
+
+        out = self._content[where]
+        if isinstance(out, awkward.array.jagged.JaggedArray):
+            return StringArray(out.starts, out.stops, out.content, encoding=self._encoding, writeable=self.writeable)
+        else:
+            return out
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self):
+        # one bytes object and one decode for the whole array, then a slice per string
+        starts = self._content.starts
+        stops = self._content.stops[:len(starts)]
+        content = self._content.content
+        data = content.tobytes()
+        encoding = self._normalencoding()
+
+        if encoding is None:
+            return [data[start:stop] for start, stop in awkward.util.izip(starts.tolist(), stops.tolist())]
+
+        elif encoding == "latin1" or (encoding in ("utf8", "ascii") and not (content >= 128).any()):
+            text = data.decode(self._encoding)
+            return [text[start:stop] for start, stop in awkward.util.izip(starts.tolist(), stops.tolist())]
+
+        elif encoding == "utf8":
+            try:
+                text = data.decode(self._encoding)
+            except UnicodeDecodeError:
+                pass      # bytes between the strings are not valid UTF-8; decode each string instead
+            else:
+                # the slices are only right if every non-empty string starts and stops on a character boundary;
+                # otherwise decode each string, which raises UnicodeDecodeError as __getitem__ does
+                nonempty = (stops > starts)
+                first = starts[nonempty]
+                after = stops[nonempty]
+                after = after[after < len(content)]
+                if not ((content[first] & 0xc0) == 0x80).any() and not ((content[after] & 0xc0) == 0x80).any():
+                    # character offset of each byte: the number of non-continuation bytes before it
+                    chars = numpy.empty(len(content) + 1, dtype=self.INDEXTYPE)
+                    chars[0] = 0
+                    numpy.cumsum((content & 0xc0) != 0x80, out=chars[1:])
+                    return [text[start:stop] for start, stop in awkward.util.izip(chars[starts].tolist(), chars[stops].tolist())]
+
+        return [data[start:stop].decode(self._encoding) for start, stop in awkward.util.izip(starts.tolist(), stops.tolist())]
+
+    def _normalencoding(self):
+        if self._encoding is None:
+            return None
+        else:
+            return self._encoding.replace("-", "").replace("_", "").lower()
+
+    def length(self):
+        # number of characters in each string
+        if self._encoding is None:
+            return self.counts
+        elif self._normalencoding() == "utf8":
+            # every UTF-8 character has exactly one byte that is not a continuation byte (0b10xxxxxx)
+            content = self._content
+            isfirst = (content.content & 0xc0) != 0x80
+            return awkward.array.jagged.JaggedArray(content.starts, content.stops, isfirst).count_nonzero()
+        else:
+            return numpy.array([len(x) for x in self.tolist()], dtype=self.INDEXTYPE)
+
+    def _encode(self, value):
+        if isinstance(value, bytes):
+            return value
+        elif self._encoding is None:
+            raise TypeError("cannot compare bytestrings with {0}".format(type(value)))
+        else:
+            return value.encode(self._encoding)
+
+    def _prefixequal(self, prefix, which):
+        # compare the first len(prefix) bytes of the strings in `which` with prefix, all at once
+        if len(prefix) == 0:
+            return numpy.ones(len(which), dtype=numpy.bool_)
+        index = self._content.starts[which][:, numpy.newaxis] + numpy.arange(len(prefix), dtype=self.INDEXTYPE)
+        return (self._content.content[index] == numpy.frombuffer(prefix, dtype=self.CHARTYPE)).all(axis=1)
+
+    def _equal(self, other):
+        out = numpy.zeros(len(self), dtype=numpy.bool_)
+
+        if isinstance(other, StringArray):
+            if len(other) != len(self):
+                raise ValueError("cannot compare StringArrays of different lengths: {0} and {1}".format(len(self), len(other)))
+            which = numpy.nonzero(self._content._counts() == other._content._counts())[0]
+            same = self._content[which].flatten() == other._content[which].flatten()
+            out[which] = awkward.array.jagged.JaggedArray.fromcounts(self._content._counts()[which], same).all()
+
+        else:
+            other = self._encode(other)
+            which = numpy.nonzero(self._content._counts() == len(other))[0]
+            out[which] = self._prefixequal(other, which)
+
+        return out
+
+    def startswith(self, prefix):
+        prefix = self._encode(prefix)
+        out = numpy.zeros(len(self), dtype=numpy.bool_)
+        which = numpy.nonzero(self._content._counts() >= len(prefix))[0]
+        out[which] = self._prefixequal(prefix, which)
+        return out
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or ufunc not in (numpy.equal, numpy.not_equal) or len(inputs) != 2 or len(kwargs) != 0:
+            return NotImplemented
+
+        other = inputs[1] if inputs[0] is self else inputs[0]
+        if isinstance(other, StringArray) or isinstance(other, (bytes, awkward.util.string)):
+            out = self._equal(other)
+        else:
+            return NotImplemented
+
+        if ufunc is numpy.equal:
+            return out
+        else:
+            return numpy.logical_not(out)
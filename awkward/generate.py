@@ -35,10 +35,11 @@ import numpy
 import awkward.array.base
 import awkward.util
 from awkward.array.chunked import ChunkedArray, PartitionedArray, AppendableArray
-from awkward.array.indexed import IndexedArray, ByteIndexedArray, IndexedMaskedArray, UnionArray
+from awkward.array.indexed import IndexedArray, ByteIndexedArray, CategoricalArray, IndexedMaskedArray, UnionArray
 from awkward.array.jagged import JaggedArray, ByteJaggedArray
 from awkward.array.masked import MaskedArray, BitMaskedArray
 from awkward.array.sparse import SparseArray
+from awkward.array.strings import StringArray
 from awkward.array.table import Table
 from awkward.array.virtual import VirtualArray, VirtualObjectArray, PersistentArray
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# run with: python benchmarks/bench_indexed.py
+
+import timeit
+
+import numpy
+
+from awkward import ByteIndexedArray
+
+def timed(function, number=5):
+    return min(timeit.repeat(function, number=1, repeat=number))
+
+def report(name, rows):
+    print(name)
+    for label, seconds in rows:
+        print("    {0:45s} {1:10.6f} sec".format(label, seconds))
+
+DTYPES = [("8-byte", numpy.dtype(numpy.float64)),
+          ("16-byte", numpy.dtype(numpy.complex128)),
+          ("32-byte", numpy.dtype([("px", numpy.float64), ("py", numpy.float64), ("pz", numpy.float64), ("E", numpy.float64)]))]
+
+def records(dtype, numrecords, padding):
+    # numrecords records of dtype, each preceded by padding bytes, in shuffled order
+    stride = dtype.itemsize + padding
+    content = numpy.zeros(numrecords * stride, dtype=numpy.uint8)
+    index = numpy.random.RandomState(12345).permutation(numrecords) * stride + padding
+    return ByteIndexedArray(index, content, dtype)
+
+def getitem_bytes(a, starts):
+    # the per-byte index arrays that ByteIndexedArray.__getitem__ used before it gathered whole records
+    itemsize = a.dtype.itemsize
+    hold = numpy.empty(len(starts), dtype=a.dtype)
+    contidx = numpy.empty(len(starts) * itemsize, dtype=a.INDEXTYPE)
+    contidx[::itemsize] = starts
+    for offset in range(1, itemsize):
+        contidx[offset::itemsize] = contidx[::itemsize] + offset
+    holdidx = numpy.empty(len(starts) * itemsize, dtype=a.INDEXTYPE)
+    holdidx[::itemsize] = numpy.arange(0, len(starts) * itemsize, itemsize)
+    for offset in range(1, itemsize):
+        holdidx[offset::itemsize] = holdidx[::itemsize] + offset
+    numpy.frombuffer(hold, dtype=a.CHARTYPE)[holdidx] = a.content[contidx]
+    return hold
+
+def bench_getitem():
+    rows = []
+    for numrecords in 100000, 1000000:
+        for name, dtype in DTYPES:
+            for layout, padding in ("aligned", 0), ("unaligned", 1):
+                a = records(dtype, numrecords, padding)
+                rows.append(("{0} {1}, {2} records".format(name, layout, numrecords), timed(lambda: a[:])))
+            rows.append(("{0} per-byte index, {1} records".format(name, numrecords), timed(lambda: getitem_bytes(a, a.index))))
+    report("ByteIndexedArray.__getitem__", rows)
+
+def bench_setitem():
+    rows = []
+    for numrecords in 100000, 1000000:
+        for name, dtype in DTYPES:
+            values = numpy.zeros(numrecords, dtype=dtype)
+            for layout, padding in ("aligned", 0), ("unaligned", 1):
+                a = records(dtype, numrecords, padding)
+                def setitem():
+                    a[:] = values
+                rows.append(("{0} {1}, {2} records".format(name, layout, numrecords), timed(setitem)))
+    report("ByteIndexedArray.__setitem__", rows)
+
+if __name__ == "__main__":
+    bench_getitem()
+    bench_setitem()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# run with: python benchmarks/bench_jagged.py
+
+import timeit
+
+import numpy
+
+from awkward import JaggedArray
+
+def timed(function, number=5):
+    return min(timeit.repeat(function, number=1, repeat=number))
+
+def report(name, rows):
+    print(name)
+    for label, seconds in rows:
+        print("    {0:45s} {1:10.6f} sec".format(label, seconds))
+
+def contiguous(numevents, contentlength):
+    counts = numpy.random.RandomState(12345).multinomial(contentlength, numpy.ones(numevents) / numevents)
+    return JaggedArray.fromcounts(counts, numpy.arange(contentlength, dtype=numpy.float64))
+
+def noncontiguous(numevents, contentlength):
+    a = contiguous(numevents, contentlength)
+    order = numpy.random.RandomState(12345).permutation(numevents)
+    return JaggedArray(a.starts[order], a.stops[order], a.content)
+
+def bench_parents():
+    rows = []
+    for numevents in 1000, 10000, 100000, 1000000:
+        a = contiguous(numevents, 10000000)
+        rows.append(("contiguous, {0} events, 1e7 content".format(numevents), timed(lambda: a.parents)))
+    for contentlength in 1000000, 10000000, 30000000:
+        a = contiguous(100000, contentlength)
+        rows.append(("contiguous, 1e5 events, {0} content".format(contentlength), timed(lambda: a.parents)))
+    for numevents in 1000, 100000, 1000000:
+        a = noncontiguous(numevents, 10000000)
+        rows.append(("noncontiguous, {0} events, 1e7 content".format(numevents), timed(lambda: a.parents)))
+    report("JaggedArray.parents", rows)
+
+def bench_localindex():
+    rows = []
+    for contentlength in 1000000, 10000000:
+        a = contiguous(100000, contentlength)
+        rows.append(("contiguous, 1e5 events, {0} content".format(contentlength), timed(lambda: a.localindex)))
+    report("JaggedArray.localindex", rows)
+
+def bench_reduce():
+    rows = []
+    for numevents in 10000, 100000, 1000000:
+        a = contiguous(numevents, 10 * numevents)
+        b = noncontiguous(numevents, 10 * numevents)
+        rows.append(("sum, contiguous, {0} events".format(numevents), timed(lambda: a.sum())))
+        rows.append(("sum, noncontiguous, {0} events".format(numevents), timed(lambda: b.sum())))
+    report("JaggedArray._reduce", rows)
+
+def setitem_loop(a, where, what):
+    # the per-sublist loop that JaggedArray.__setitem__ used before it scattered in one step
+    starts, stops = a.starts[where], a.stops[where]
+    if isinstance(what, numpy.ndarray):
+        this = 0
+        for start, stop in zip(starts, stops):
+            a.content[start:stop] = what[this:this + stop - start]
+            this += stop - start
+    else:
+        for start, stop in zip(starts, stops):
+            a.content[start:stop] = what
+
+def bench_setitem():
+    rows = []
+    for numevents in 10000, 100000, 1000000:
+        a = contiguous(numevents, 10 * numevents)
+        mask = numpy.random.RandomState(12345).randint(0, 2, numevents).astype(numpy.bool_)
+        values = numpy.zeros(a.counts[mask].sum())
+
+        def vectorized():
+            a[mask] = 0
+        def loop():
+            setitem_loop(a, mask, 0)
+        rows.append(("scalar, {0} events, vectorized".format(numevents), timed(vectorized)))
+        rows.append(("scalar, {0} events, loop".format(numevents), timed(loop, number=1)))
+
+        def vectorized():
+            a[mask] = values
+        def loop():
+            setitem_loop(a, mask, values)
+        rows.append(("flat, {0} events, vectorized".format(numevents), timed(vectorized)))
+        rows.append(("flat, {0} events, loop".format(numevents), timed(loop, number=1)))
+    report("JaggedArray.__setitem__", rows)
+
+def bench_ufunc():
+    rows = []
+    for numevents in 10000, 100000, 1000000:
+        a = noncontiguous(numevents, 10 * numevents)
+        weights = numpy.random.RandomState(12345).uniform(0, 1, numevents)
+
+        def uncached():
+            a.clearderived()
+            a * weights + weights
+        def cached():
+            a * weights + weights
+        rows.append(("a * w + w, {0} events, uncached".format(numevents), timed(uncached)))
+        rows.append(("a * w + w, {0} events, cached".format(numevents), timed(cached)))
+    report("JaggedArray.__array_ufunc__", rows)
+
+def bench_topk():
+    # both methods on both sides of JaggedArray.TOPK_MAXROUNDS, to check where the switch belongs
+    rows = []
+    default = JaggedArray.TOPK_MAXROUNDS
+    for numevents, perevent in (100000, 10), (100000, 30), (10000, 100):
+        a = contiguous(numevents, perevent * numevents)
+        a.content = numpy.random.RandomState(12345).uniform(0, 1, len(a.content))
+        for k in 1, 4, default, default + 1, 2 * default, 4 * default:
+            try:
+                JaggedArray.TOPK_MAXROUNDS = len(a.content)
+                rows.append(("rounds, {0} per event, k={1}".format(perevent, k), timed(lambda: a.argtopk(k), number=3)))
+                JaggedArray.TOPK_MAXROUNDS = -1
+                rows.append(("sort, {0} per event, k={1}".format(perevent, k), timed(lambda: a.argtopk(k), number=3)))
+            finally:
+                JaggedArray.TOPK_MAXROUNDS = default
+    report("JaggedArray.argtopk", rows)
+
+def bench_searchsorted():
+    rows = []
+    for numevents in 10000, 100000, 1000000:
+        a = contiguous(numevents, 5 * numevents)
+        values = numpy.random.RandomState(12345).uniform(0, 5 * numevents, numevents)
+        queries = JaggedArray.fromcounts(a.counts, numpy.sort(numpy.random.RandomState(12345).uniform(0, 5 * numevents, len(a.content))))
+        rows.append(("scalar, {0} events".format(numevents), timed(lambda: a.searchsorted(2.5 * numevents))))
+        rows.append(("one per event, {0} events".format(numevents), timed(lambda: a.searchsorted(values))))
+        rows.append(("jagged, {0} events".format(numevents), timed(lambda: a.searchsorted(queries))))
+        rows.append(("sort, for comparison, {0} events".format(numevents), timed(lambda: a.sort())))
+    report("JaggedArray.searchsorted", rows)
+
+def bench_bytejagged_setitem():
+    from awkward import ByteJaggedArray
+    rows = []
+    for numevents in 10000, 100000, 1000000:
+        a = contiguous(numevents, 10 * numevents)
+        aligned = ByteJaggedArray(a.starts * 8, a.stops * 8, a.content.tobytes(), numpy.float64)
+        unaligned = ByteJaggedArray(a.starts * 8 + 1, a.stops * 8 + 1, b"\x00" + a.content.tobytes(), numpy.float64)
+        values = numpy.zeros(len(a.content))
+
+        def alignedset():
+            aligned[:] = values
+        def unalignedset():
+            unaligned[:] = values
+        rows.append(("aligned, {0} events".format(numevents), timed(alignedset)))
+        rows.append(("unaligned, {0} events".format(numevents), timed(unalignedset)))
+    report("ByteJaggedArray.__setitem__", rows)
+
+if __name__ == "__main__":
+    bench_parents()
+    bench_localindex()
+    bench_reduce()
+    bench_setitem()
+    bench_ufunc()
+    bench_topk()
+    bench_searchsorted()
+    bench_bytejagged_setitem()
@@ -150,6 +150,17 @@ class TestChunked(unittest.TestCase):
         self.assertEqual(a[[True, False, True, False, True, False, True, False, True, False], 0].tolist(), [0.0, 2.0, 4.0, 6.0, 8.0])
         self.assertEqual(a[[True, False, True, False, True, False, True, False, True, False], 1].tolist(), [0.0, 2.2, 4.4, 6.6, 8.8])
 
+    def test_chunked_histogram(self):
+        a = ChunkedArray([[0.5, 1.5, 2.5], [], [1.0, 9.0]])
+        self.assertEqual(a.histogram(3, range=(0, 3))[0].tolist(), [1, 2, 1])
+        b = JaggedArray.fromiter([[0.5, 1.5, 2.5, 3.0], [], [1.0, 9.0], [-1.0, 2.0]])
+        c = ChunkedArray([b, b[2:]])
+        self.assertEqual(c.histogram(3, range=(0, 3))[0].tolist(), [1, 3, 4])
+        self.assertEqual(c.histogram([0, 1, 2, 3], per_event_weights=ChunkedArray([[1, 1, 1, 1], [10, 10]]))[0].tolist(), [1, 12, 13])
+        self.assertRaises(ValueError, lambda: c.histogram(3))
+        self.assertRaises(ValueError, lambda: c.histogram(3, range=(0, 3), per_event_weights=ChunkedArray([[1, 1, 1, 1]])))
+        self.assertRaises(ValueError, lambda: c.histogram(3, range=(0, 3), per_event_weights=ChunkedArray([[1, 1, 1], [10, 10, 10]])))
+
     def test_chunked_set_const(self):
         a = ChunkedArray([[], [0, 1, 2, 3, 4], [5, 6], [], [7, 8, 9], []])
         a[0] = 999
@@ -113,6 +113,27 @@ class TestIndexed(unittest.TestCase):
         self.assertEqual(a[[3, 2, 1, 0]].tolist(), [0, 1, 2, 3])
         self.assertEqual(a[[True, False, True, False]].tolist(), [3, 1])
 
+    def test_byteindexed_getrecord(self):
+        dtype = numpy.dtype([("x", numpy.float64), ("y", numpy.int32)])
+        data = numpy.array([(1.1, 1), (2.2, 2), (3.3, 3)], dtype=dtype)
+        a = ByteIndexedArray([2*dtype.itemsize + 3, 3, dtype.itemsize + 3], b"\xff\xff\xff" + data.tobytes(), dtype)
+        self.assertEqual(a[:].tolist(), [(3.3, 3), (1.1, 1), (2.2, 2)])
+        a[[0, 1]] = numpy.array([(9.9, 9), (8.8, 8)], dtype=dtype)
+        self.assertEqual(a[:].tolist(), [(9.9, 9), (8.8, 8), (2.2, 2)])
+        self.assertEqual(a.content[:3].tolist(), [255, 255, 255])
+
+    def test_byteindexed_strided(self):
+        content = numpy.arange(40, dtype=numpy.uint8)[::2]
+        for index in [1, 5], [2, 6]:
+            a = ByteIndexedArray(index, content, numpy.int16)
+            expect = [numpy.frombuffer(content[i:i + 2].tobytes(), numpy.int16)[0] for i in index]
+            self.assertEqual(a[:].tolist(), expect)
+            a[:] = [-1, -2]
+            self.assertEqual(a[:].tolist(), [-1, -2])
+            self.assertEqual(a[1], -2)
+            a[0] = 7
+            self.assertEqual(a[0], 7)
+
     def test_byteindexed_set(self):
         # HINT: if we pass a bytes literal into the ByteIndexedArray, this operation will change the
         # bytes of the literal itself everywhere it appears, making test results hard to interpret.
@@ -176,6 +197,45 @@ class TestIndexed(unittest.TestCase):
         self.assertEqual([a[i] for i in range(len(a))], [2, 1, 0])
         self.assertEqual(a[:].tolist(), [2, 1, 0])
 
+    def test_categorical_fromvalues(self):
+        a = CategoricalArray.fromvalues(["b", "a", "c", "a", "b"])
+        self.assertEqual(a.content.tolist(), ["a", "b", "c"])
+        self.assertEqual(a.index.tolist(), [1, 0, 2, 0, 1])
+        self.assertEqual(a.index.dtype, numpy.dtype(numpy.uint8))
+        self.assertEqual(a.tolist(), ["b", "a", "c", "a", "b"])
+        self.assertEqual(a[1:3].tolist(), ["a", "c"])
+        self.assertEqual(CategoricalArray.fromvalues(numpy.arange(300) % 257).index.dtype, numpy.dtype(numpy.uint16))
+
+    def test_categorical_equal(self):
+        a = CategoricalArray.fromvalues(["b", "a", "c", "a", "b"])
+        self.assertEqual((a == "a").tolist(), [False, True, False, True, False])
+        self.assertEqual((a != "a").tolist(), [True, False, True, False, True])
+        self.assertEqual(("b" == a).tolist(), [True, False, False, False, True])
+        self.assertEqual((a == "z").tolist(), [False, False, False, False, False])
+        self.assertEqual((a == numpy.array(["b", "b", "c", "c", "c"])).tolist(), [True, False, True, False, False])
+        b = CategoricalArray([0, 1, 1, 2], [1.1, 2.2, 1.1])
+        self.assertEqual((b == 1.1).tolist(), [True, False, False, True])
+        self.assertEqual((b + 1).tolist(), [2.1, 3.2, 3.2, 2.1])
+
+    def test_categorical_set(self):
+        a = CategoricalArray.fromvalues(["b", "a", "c", "a", "b"])
+        a[0] = "z"
+        self.assertEqual(a.tolist(), ["z", "a", "c", "a", "b"])
+        a[[1, 2]] = ["b", "zz"]
+        self.assertEqual(a.tolist(), ["z", "b", "zz", "a", "b"])
+        self.assertEqual(a.content.tolist(), ["a", "b", "c", "z", "zz"])
+        b = CategoricalArray.fromvalues(numpy.arange(256))
+        b[0] = 1000
+        self.assertEqual(b.index.dtype, numpy.dtype(numpy.uint16))
+        self.assertEqual(b[:3].tolist(), [1000, 1, 2])
+        c = CategoricalArray.fromvalues([1, 2, 3])
+        self.assertRaises(ValueError, lambda: c.__setitem__(0, "q"))
+        self.assertRaises(ValueError, lambda: c.__setitem__(0, 1.5))
+        c[0] = 4.0
+        self.assertEqual(c.tolist(), [4, 2, 3])
+        self.assertEqual(c.content.dtype, numpy.dtype(int))
+        self.assertRaises(ValueError, lambda: CategoricalArray.fromvalues(numpy.array([1, 2], numpy.uint8)).__setitem__(0, 1000))
+
     def test_union_get(self):
         a = UnionArray([0, 1, 0, 1, 0, 1, 0, 1, 0, 1], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [[0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9], [0, 100, 200, 300, 400, 500, 600, 700, 800, 900]])
         self.assertEqual(a.tolist(), [0.0, 100, 2.2, 300, 4.4, 500, 6.6, 700, 8.8, 900])
@@ -55,6 +55,19 @@ class TestJagged(unittest.TestCase):
         b = JaggedArray([0, 3, 3, 8, 10], [3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         self.assertTrue(JaggedArray.compatible(a, b))
 
+    def test_jagged_fromuniques(self):
+        a = JaggedArray.fromuniques([1, 1, 2, 3, 3, 3], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5])
+        self.assertEqual(a.tolist(), [[0.0, 1.1], [2.2], [3.3, 4.4, 5.5]])
+
+    def test_jagged_groupby(self):
+        a = JaggedArray.groupby([3, 1, 3, 2, 1], [0.0, 1.1, 2.2, 3.3, 4.4])
+        self.assertEqual(a.tolist(), [[1.1, 4.4], [3.3], [0.0, 2.2]])
+        self.assertEqual(JaggedArray.groupby(numpy.array(["b", "a", "b"]), numpy.arange(3)).tolist(), [[1], [0, 2]])
+        self.assertRaises(ValueError, lambda: JaggedArray.groupby([1, 2], [0.0]))
+        a, keys = JaggedArray.groupby([3, 1, 3, 2, 1], [0.0, 1.1, 2.2, 3.3, 4.4], return_keys=True)
+        self.assertEqual(keys.tolist(), [1, 2, 3])
+        self.assertEqual(a.tolist(), [[1.1, 4.4], [3.3], [0.0, 2.2]])
+
     def test_jagged_get(self):
         a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         self.assertEqual([a[i].tolist() for i in range(len(a))], [[0.0, 1.1, 2.2], [], [3.3, 4.4, 5.5, 6.6, 7.7], [8.8, 9.9], []])
@@ -94,6 +107,69 @@ class TestJagged(unittest.TestCase):
         a = JaggedArray([], [], [0.0, 1.1, 2.2, 3.3, 4.4])
         self.assertEqual(a[:].tolist(), [])
 
+    def test_jagged_getjagged(self):
+        a = JaggedArray.fromiter([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6, 7.7, 8.8, 9.9]])
+        self.assertEqual(a[a > 3].tolist(), [[3.3], [], [4.4, 5.5], [6.6, 7.7, 8.8, 9.9]])
+        self.assertTrue(a[a > 3].content is a.content)
+        self.assertEqual(a[(a < 2) | (a > 7)].tolist(), [[1.1], [], [], [7.7, 8.8, 9.9]])
+        self.assertEqual(a[(a < 2) | (a > 9)].tolist(), [[1.1], [], [], [9.9]])
+        self.assertEqual(a[(a > 2) & (a < 3) | (a > 9)].tolist(), [[2.2], [], [], [9.9]])
+        self.assertEqual(a[(a < 2) | (a > 3) & (a < 7) | (a > 9)].tolist(), [[1.1, 3.3], [], [4.4, 5.5], [6.6, 9.9]])
+        self.assertEqual(a[JaggedArray.fromiter([[2, 0], [], [-1], [1, 1, 3]])].tolist(), [[3.3, 1.1], [], [5.5], [7.7, 7.7, 9.9]])
+        self.assertEqual(a[::-1][a[::-1] > 5].tolist(), [[6.6, 7.7, 8.8, 9.9], [5.5], [], []])
+        self.assertRaises(IndexError, lambda: a[JaggedArray.fromiter([[3], [], [], []])])
+        self.assertRaises(IndexError, lambda: a[JaggedArray.fromiter([[True], [], [True], [True]])])
+
+    def test_jagged_gettuple(self):
+        a = JaggedArray.fromiter([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6, 7.7, 8.8, 9.9]])
+        self.assertEqual(a[[0, 2, 3], 0].tolist(), [1.1, 4.4, 6.6])
+        self.assertEqual(a[[True, False, True, True], -1].tolist(), [3.3, 5.5, 9.9])
+        self.assertEqual(a[:, 0].tolist(), [1.1, None, 4.4, 6.6])
+        self.assertEqual(a[:, 2].tolist(), [3.3, None, None, 8.8])
+        self.assertEqual(a[2, -1], 5.5)
+        self.assertEqual(a[:, :2].tolist(), [[1.1, 2.2], [], [4.4, 5.5], [6.6, 7.7]])
+        self.assertTrue(a[:, :2].content is a.content)
+        self.assertEqual(a[:, -2:].tolist(), [[2.2, 3.3], [], [4.4, 5.5], [8.8, 9.9]])
+        self.assertEqual(a[:, ::2].tolist(), [[1.1, 3.3], [], [4.4], [6.6, 8.8]])
+        self.assertEqual(a[:, ::-1].tolist(), [[3.3, 2.2, 1.1], [], [5.5, 4.4], [9.9, 8.8, 7.7, 6.6]])
+        self.assertEqual(a[:, 3:0:-2].tolist(), [[3.3], [], [5.5], [9.9, 7.7]])
+
+        b = JaggedArray.fromoffsets([0, 3, 3, 5, 9, 10], numpy.arange(20).reshape(10, 2))
+        self.assertEqual(b[:, :2, 0].tolist(), [[0, 2], [], [6, 8], [10, 12], [18]])
+
+    def test_jagged_flatten(self):
+        a = JaggedArray.fromiter([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6, 7.7, 8.8, 9.9]])
+        self.assertEqual(a.flatten().tolist(), [1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a[[3, 0]].flatten().tolist(), [6.6, 7.7, 8.8, 9.9, 1.1, 2.2, 3.3])
+
+    def test_jagged_pad(self):
+        a = JaggedArray.fromiter([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6, 7.7, 8.8, 9.9]])
+        self.assertEqual(a.pad(2).tolist(), [[1.1, 2.2], [None, None], [4.4, 5.5], [6.6, 7.7]])
+        self.assertEqual(a.pad(2, clip=False).shape, (4, 4))
+        self.assertEqual(a.pad(3, fill=0).tolist(), [[1.1, 2.2, 3.3], [0, 0, 0], [4.4, 5.5, 0], [6.6, 7.7, 8.8]])
+        self.assertEqual(JaggedArray.fromregular(a.pad(5)).tolist(), a.tolist())
+        self.assertEqual(JaggedArray.fromregular(numpy.arange(6).reshape(3, 2)).tolist(), [[0, 1], [2, 3], [4, 5]])
+
+    def test_jagged_concatenate(self):
+        a = JaggedArray.fromiter([[1.1, 2.2], [], [3.3]])
+        b = JaggedArray.fromiter([[4.4], [5.5, 6.6], []])
+        self.assertEqual(JaggedArray.concatenate([a, b]).tolist(), [[1.1, 2.2], [], [3.3], [4.4], [5.5, 6.6], []])
+        self.assertEqual(JaggedArray.concatenate([a, b[::-1]]).tolist(), [[1.1, 2.2], [], [3.3], [], [5.5, 6.6], [4.4]])
+        self.assertEqual(JaggedArray.concatenate([a, b], axis=1).tolist(), [[1.1, 2.2, 4.4], [5.5, 6.6], [3.3]])
+        self.assertEqual(JaggedArray.concatenate([b[::-1], a, a], axis=1).tolist(), [[1.1, 2.2, 1.1, 2.2], [5.5, 6.6], [4.4, 3.3, 3.3]])
+        self.assertRaises(ValueError, lambda: JaggedArray.concatenate([a, b[1:]], axis=1))
+
+    def test_jagged_concatenate_table(self):
+        electrons = JaggedArray.fromcounts([2, 0, 1], Table(3, pt=[1.1, 2.2, 3.3], q=[1, -1, 1]))
+        muons = JaggedArray.fromcounts([1, 1, 0], Table(2, pt=[4.4, 5.5], q=[-1, -1]))
+        c = JaggedArray.concatenate([electrons, muons])
+        self.assertEqual(c["pt"].tolist(), [[1.1, 2.2], [], [3.3], [4.4], [5.5], []])
+        self.assertEqual(c["q"].tolist(), [[1, -1], [], [1], [-1], [-1], []])
+        c = JaggedArray.concatenate([electrons, muons], axis=1)
+        self.assertEqual(c["pt"].tolist(), [[1.1, 2.2, 4.4], [5.5], [3.3]])
+        self.assertEqual(c["q"].tolist(), [[1, -1, -1], [-1], [1]])
+        self.assertRaises(ValueError, lambda: JaggedArray.concatenate([electrons, JaggedArray.fromcounts([1, 1, 0], Table(2, pt=[4.4, 5.5]))]))
+
     def test_jagged_jagged(self):
         a = JaggedArray.fromoffsets([0, 3, 3, 5], JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
         self.assertEqual([a[i].tolist() for i in range(len(a))], [[[0.0, 1.1, 2.2], [], [3.3, 4.4, 5.5, 6.6, 7.7]], [], [[8.8, 9.9], []]])
@@ -133,6 +209,227 @@ class TestJagged(unittest.TestCase):
         a[0:3] = JaggedArray.fromoffsets([0, 3, 3, 8], [101, 102, 103, 104, 105, 106, 107, 108])
         self.assertEqual([x.tolist() for x in a], [[101.0, 102.0, 103.0], [], [104.0, 105.0, 106.0, 107.0, 108.0], [8.8, 9.9], []])
 
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        a[[True, False, True, True, False]] = JaggedArray.fromoffsets([0, 1, 2, 4], [101, 102, 103, 104])
+        self.assertEqual([x.tolist() for x in a], [[101.0, 101.0, 101.0], [], [102.0, 102.0, 102.0, 102.0, 102.0], [103.0, 104.0], []])
+
+        a = JaggedArray.fromoffsets([0, 3, 3, 5], [0.0, 1.1, 2.2, 3.3, 4.4])
+        a[:] = ByteJaggedArray.fromiter([[10, 20, 30], [], [40, 50]])
+        self.assertEqual(a.tolist(), [[10.0, 20.0, 30.0], [], [40.0, 50.0]])
+
+        a = JaggedArray([5, 2, 99, 0], [8, 4, 99, 2], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        a[[0, 3]] = [101, 102, 103, 104, 105]
+        self.assertEqual(a.content.tolist(), [104.0, 105.0, 2.2, 3.3, 4.4, 101.0, 102.0, 103.0, 8.8, 9.9])
+
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        def quickie():
+            a[0:3] = JaggedArray.fromoffsets([0, 2, 2, 4], [101, 102, 103, 104])
+        self.assertRaises(ValueError, quickie)
+
+    def test_jagged_parents(self):
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a.parents.tolist(), [0, 0, 0, 2, 2, 2, 2, 2, 3, 3])
+
+        a = JaggedArray.fromoffsets([2, 3, 3, 8], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a.parents.tolist(), [-1, -1, 0, 2, 2, 2, 2, 2, -1, -1])
+
+        a = JaggedArray([5, 0, 99, 3], [8, 3, 99, 4], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a.parents.tolist(), [1, 1, 1, 3, -1, 0, 0, 0, -1, -1])
+
+        a = JaggedArray([], [], [0.0, 1.1, 2.2])
+        self.assertEqual(a.parents.tolist(), [-1, -1, -1])
+
+        a = JaggedArray([0, 2], [2, 3, 5], [0.0, 1.1, 2.2, 3.3, 4.4])
+        self.assertEqual(a.parents.tolist(), [0, 0, 1, -1, -1])
+        self.assertEqual((a + numpy.array([1, 2])).tolist(), [[1.0, 2.1], [4.2]])
+
+    def test_jagged_derived(self):
+        a = JaggedArray([5, 0, 9, 3], [8, 2, 9, 5], numpy.arange(10))
+        self.assertEqual(a.derivednbytes, 0)
+        self.assertTrue(a._counts() is a._counts())
+        self.assertTrue(a._parents() is a._parents())
+        self.assertEqual(a.derivednbytes, a.counts.nbytes + a.parents.nbytes)
+
+        # the public arrays are writable copies; the cached ones are not modified
+        counts = a.counts
+        counts[counts > 2] = 2
+        self.assertEqual(a.counts.tolist(), [3, 2, 0, 2])
+        self.assertRaises(ValueError, lambda: a._counts().__setitem__(0, 1))
+
+        b = a * numpy.array([1, 2, 3, 4]) + numpy.array([0, 0, 0, 100])
+        self.assertEqual(b.tolist(), [[5, 6, 7], [0, 2], [], [112, 116]])
+        self.assertTrue(b._parents() is a._parents())
+
+        a.starts = [5, 1, 9, 3]
+        self.assertEqual(a.derivednbytes, 0)
+        self.assertEqual(a.counts.tolist(), [3, 1, 0, 2])
+        self.assertEqual(b.counts.tolist(), [3, 2, 0, 2])
+
+        a = JaggedArray([0, 2], [2, 3, 5], numpy.arange(5))
+        self.assertEqual(a.counts.tolist(), [2, 1])
+        self.assertEqual(a.sum().tolist(), [1, 2])
+
+    def test_jagged_localindex(self):
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a.localindex.tolist(), [[0, 1, 2], [], [0, 1, 2, 3, 4], [0, 1], []])
+
+        a = JaggedArray([5, 0, 99, 3], [8, 3, 99, 4], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertEqual(a.localindex.tolist(), [[0, 1, 2], [0, 1, 2], [], [0]])
+        self.assertEqual(ByteJaggedArray.fromiter([[1, 2, 3], [], [4]]).localindex.tolist(), [[0, 1, 2], [], [0]])
+
+    def test_bytejagged_reduce(self):
+        a = ByteJaggedArray.fromiter([[1, 257, 0], [], [-3]])
+        self.assertEqual(a.count_nonzero().tolist(), [2, 0, 1])
+        self.assertEqual(a.min().tolist(), [0, numpy.iinfo(numpy.int64).max, -3])
+        self.assertEqual(a.max().tolist(), [257, numpy.iinfo(numpy.int64).min, -3])
+        self.assertEqual(numpy.minimum.reduce(a).tolist(), [0, numpy.iinfo(numpy.int64).max, -3])
+        self.assertEqual(numpy.maximum.reduce(a).tolist(), [257, numpy.iinfo(numpy.int64).min, -3])
+        b = ByteJaggedArray([0, 16, 16], [16, 16, 24], numpy.array([3.0, 1.0, 2.0]).view(numpy.uint8), numpy.float64)
+        self.assertEqual(numpy.minimum.reduce(b).tolist(), [1.0, numpy.inf, 2.0])
+        self.assertEqual(numpy.maximum.reduce(b).tolist(), [3.0, -numpy.inf, 2.0])
+        self.assertEqual(numpy.add.reduce(b).tolist(), [4.0, 0.0, 2.0])
+
+    def test_jagged_reduce_permuted(self):
+        counts = numpy.random.RandomState(12345).poisson(3, 200000)
+        a = JaggedArray.fromcounts(counts, numpy.arange(counts.sum(), dtype=numpy.float64) % 7)
+        b = a[numpy.random.RandomState(12345).permutation(len(a))]
+        c = JaggedArray.fromcounts(b.counts, b.flatten())
+        self.assertTrue(numpy.array_equal(b.sum(), c.sum()))
+        self.assertTrue(numpy.array_equal(b.max(), c.max()))
+        self.assertTrue(numpy.array_equal(b.argmin().content, c.argmin().content))
+
+    def test_jagged_reduce(self):
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(a.sum().tolist(), [3.0, 0.0, 25.0, 17.0, 0.0])
+        self.assertEqual(a.prod().tolist(), [0.0, 1.0, 2520.0, 72.0, 1.0])
+        self.assertEqual(a.min().tolist(), [0.0, numpy.inf, 3.0, 8.0, numpy.inf])
+        self.assertEqual(a.max().tolist(), [2.0, -numpy.inf, 7.0, 9.0, -numpy.inf])
+        self.assertEqual(a.any().tolist(), [True, False, True, True, False])
+        self.assertEqual(a.all().tolist(), [False, True, True, True, True])
+        self.assertEqual(a.count_nonzero().tolist(), [2, 0, 5, 2, 0])
+        self.assertEqual(numpy.add.reduce(a).tolist(), [3.0, 0.0, 25.0, 17.0, 0.0])
+
+        a = JaggedArray([5, 2, 99, 1, 8], [8, 7, 99, 3, 10], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(a.sum().tolist(), [18, 20, 0, 3, 17])
+        self.assertEqual(a.min().tolist(), [5, 2, numpy.iinfo(a.content.dtype).max, 1, 8])
+        self.assertEqual(a.max().tolist(), [7, 6, numpy.iinfo(a.content.dtype).min, 2, 9])
+        self.assertEqual(a[[4, 1, 4]].sum().tolist(), [17, 20, 17])
+        self.assertEqual(a.count_nonzero().tolist(), [3, 5, 0, 2, 2])
+
+    def test_jagged_accumulate(self):
+        a = JaggedArray.fromiter([[1, 2, 3], [], [4, -5], [6, 7, 0, 9]])
+        self.assertEqual(a.cumsum().tolist(), [[1, 3, 6], [], [4, -1], [6, 13, 13, 22]])
+        self.assertEqual(a.cumprod().tolist(), [[1, 2, 6], [], [4, -20], [6, 42, 0, 0]])
+        self.assertEqual(numpy.maximum.accumulate(a).tolist(), [[1, 2, 3], [], [4, 4], [6, 7, 7, 9]])
+        self.assertEqual(numpy.minimum.accumulate(a[::-1]).tolist(), [[6, 6, 0, 0], [4, -5], [], [1, 1, 1]])
+        self.assertTrue(a.cumsum().starts is a.starts)
+        self.assertEqual(ByteJaggedArray.fromiter([[1000, 2, 3], [4]]).cumsum().tolist(), [[1000, 1002, 1005], [4]])
+
+    def test_jagged_accumulate_float32(self):
+        # large sums in earlier sublists must not leak rounding error into later ones
+        a = JaggedArray.fromcounts([100000, 4], numpy.concatenate([numpy.full(100000, 99.75, numpy.float32), numpy.array([0.25, 255.5, 0.125, 1.0], numpy.float32)]))
+        self.assertEqual(a.cumsum()[1].tolist(), [0.25, 255.75, 255.875, 256.875])
+        self.assertEqual(a.cumsum().content.dtype, numpy.dtype(numpy.float32))
+
+    def test_jagged_accumulate_float_random(self):
+        # each sublist is accumulated left to right, so the results are identical to numpy.cumsum and numpy.cumprod
+        random = numpy.random.RandomState(12345)
+        counts = random.poisson(20, 500)
+        for dtype in (numpy.float64, numpy.float32):
+            a = JaggedArray.fromcounts(counts, random.uniform(0.5, 1.5, counts.sum()).astype(dtype))
+            for b in (a, a[::-1]):
+                cumsum, cumprod = b.cumsum(), b.cumprod()
+                self.assertEqual(cumsum.content.dtype, numpy.dtype(dtype))
+                for i in range(len(b)):
+                    self.assertEqual(cumsum[i].tolist(), numpy.cumsum(b[i]).tolist())
+                    self.assertEqual(cumprod[i].tolist(), numpy.cumprod(b[i]).tolist())
+
+        # a few long sublists among many short ones (too wide to pad) are accumulated one by one
+        counts = random.poisson(3, 300)
+        counts[[5, 100, 299]] = [1000, 2000, 5000]
+        for dtype in (numpy.float64, numpy.float32):
+            a = JaggedArray.fromcounts(counts, random.uniform(0.5, 1.5, counts.sum()).astype(dtype))
+            for b in (a, a[::-1]):
+                cumsum, cumprod = b.cumsum(), b.cumprod()
+                for i in range(len(b)):
+                    self.assertEqual(cumsum[i].tolist(), numpy.cumsum(b[i]).tolist())
+                    self.assertEqual(cumprod[i].tolist(), numpy.cumprod(b[i]).tolist())
+        b = JaggedArray.fromcounts([1, 1, 1, 1, 1, 1, 1, 1, 1, 1000], numpy.ones(1009, dtype=numpy.bool_))
+        self.assertEqual(numpy.add.accumulate(b)[-1].tolist(), [True] * 1000)
+
+    def test_jagged_accumulate_nonassociative(self):
+        a = JaggedArray.fromiter([[10, 3, 2]])
+        self.assertRaises(TypeError, lambda: numpy.subtract.accumulate(a))
+        b = JaggedArray.fromiter([[True, True, False], [True]])
+        self.assertEqual(b.cumsum().tolist(), [[1, 2, 2], [1]])
+        self.assertEqual(numpy.add.accumulate(b).tolist(), [[True, True, True], [True]])
+        self.assertEqual(JaggedArray.fromoffsets([0, 3], numpy.array([100, 100, 100], numpy.uint8)).cumsum().tolist(), [[100, 200, 300]])
+        self.assertRaises(TypeError, lambda: numpy.divide.accumulate(JaggedArray.fromiter([[8.0, 2.0, 2.0, 2.0]])))
+        self.assertEqual(numpy.logical_or.accumulate(JaggedArray.fromiter([[False, True, False], [False]])).tolist(), [[False, True, True], [False]])
+
+    def test_jagged_argmax(self):
+        a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [2.2, 0.0, 1.1, 3.3, 7.7, 5.5, 7.7, 4.4, 9.9, 8.8])
+        self.assertEqual(a.argmax().tolist(), [[0], [], [1], [0], []])
+        self.assertEqual(a.argmin().tolist(), [[1], [], [0], [1], []])
+
+        a = JaggedArray([5, 0, 99, 3], [8, 3, 99, 4], [2.2, 0.0, 1.1, 3.3, 7.7, 5.5, 7.7, 4.4, 9.9, 8.8])
+        self.assertEqual(a.argmax().tolist(), [[1], [0], [], [0]])
+
+        # partially overlapping sublists
+        a = JaggedArray([2, 1], [3, 4], [2.0, 3.0, 4.0, -3.0, 5.0])
+        self.assertEqual(a.argmin().tolist(), [[0], [2]])
+        self.assertEqual(a.argmax().tolist(), [[0], [1]])
+        b = JaggedArray([2, 1], [3, 4], Table(5, id=[0, 1, 2, 3, 4]))
+        self.assertEqual(b.minby(a).tolist(), [[{"id": 2}], [{"id": 3}]])
+
+    def test_jagged_maxby(self):
+        a = JaggedArray.fromoffsets([0, 3, 3, 5], Table(5, pt=[1.1, 5.5, 2.2, 7.7, 3.3], id=[0, 1, 2, 3, 4]))
+        pt = JaggedArray.fromoffsets([0, 3, 3, 5], [1.1, 5.5, 2.2, 7.7, 3.3])
+        self.assertEqual(a.maxby(pt).tolist(), [[{"pt": 5.5, "id": 1}], [], [{"pt": 7.7, "id": 3}]])
+        self.assertEqual(a.minby(pt).tolist(), [[{"pt": 1.1, "id": 0}], [], [{"pt": 3.3, "id": 4}]])
+        self.assertRaises(ValueError, lambda: a.maxby(pt[:2]))
+
+    def test_jagged_tojagged(self):
+        a = JaggedArray([5, 2, 99, 1], [8, 7, 99, 3], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        b = a.tojagged([0, 3, 8, 8])
+        self.assertEqual(b.starts.tolist(), [0, 3, 8, 8])
+        self.assertEqual(b.stops.tolist(), [3, 8, 8, 10])
+        self.assertEqual(b.content.tolist(), [5.5, 6.6, 7.7, 2.2, 3.3, 4.4, 5.5, 6.6, 1.1, 2.2])
+
+        b = a.tojagged([1, 5, 11, 12])
+        self.assertEqual(b.tolist(), [[5.5, 6.6, 7.7], [2.2, 3.3, 4.4, 5.5, 6.6], [], [1.1, 2.2]])
+        self.assertEqual(len(b.content), 14)
+
+    def test_jagged_compact(self):
+        a = JaggedArray.fromoffsets(numpy.array([0, 3, 3, 8, 10, 10]), [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        self.assertTrue(a.compact() is a)
+
+        b = JaggedArray([0, 3, 3, 8, 10], [3, 3, 8, 10, 10], a.content)
+        self.assertTrue(b.compact().content is a.content)
+        self.assertEqual(b.compact().offsets.tolist(), [0, 3, 3, 8, 10, 10])
+
+        c = JaggedArray([5, 2, 99, 1], [8, 7, 99, 3], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]).compact()
+        self.assertEqual(c.offsets.tolist(), [0, 3, 8, 8, 10])
+        self.assertEqual(c.content.tolist(), [5.5, 6.6, 7.7, 2.2, 3.3, 4.4, 5.5, 6.6, 1.1, 2.2])
+
+    def test_bytejagged_tojagged(self):
+        a = ByteJaggedArray([5, 17, 19], [17, 17, 27], b"\xff\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\xff\xff\x04\x00\x00\x00\x05\x00\x00\x00\xff", numpy.int32)
+        b = a.tojagged()
+        self.assertEqual(b.offsets.tolist(), [0, 3, 3, 5])
+        self.assertEqual(b.content.tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(a.tojagged([1, 5, 5]).tolist(), [[1, 2, 3], [], [4, 5]])
+        self.assertEqual(a.compact().offsets.tolist(), [0, 12, 12, 20])
+        self.assertEqual(a.compact().tolist(), [[1, 2, 3], [], [4, 5]])
+
+    def test_bytejagged_tojagged_aligned(self):
+        a = ByteJaggedArray([4, 16, 16], [16, 16, 24], numpy.arange(7, dtype=numpy.int32).tobytes(), numpy.int32)
+        b = a.tojagged(copy=False)
+        self.assertEqual(b.tolist(), [[1, 2, 3], [], [4, 5]])
+        self.assertEqual(b.starts.tolist(), [1, 4, 4])
+        self.assertTrue(numpy.may_share_memory(b.content, a.content))
+        self.assertFalse(numpy.may_share_memory(a.tojagged().content, a.content))
+        self.assertEqual(a.sum().tolist(), [6, 0, 9])
+
     def test_bytejagged_offsets(self):
         a = ByteJaggedArray.fromoffsets([5, 17, 17, 25], b"\xff\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\x00\x00\x00\x05\x00\x00\x00\xff\xff", numpy.int32)
         self.assertEqual([x.tolist() for x in a], [[1, 2, 3], [], [4, 5]])
@@ -199,6 +496,82 @@ class TestJagged(unittest.TestCase):
         self.assertEqual(a.content.tobytes(), b"\xff\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\xff\xff\x05\x00\x00\x00\x04\x00\x00\x00\xff")
         self.assertEqual([a[i].tolist() for i in range(len(a))], [[3, 2, 1], [], [5, 4]])
 
+    def test_bytejagged_set_aligned(self):
+        a = ByteJaggedArray([4, 16, 16], [16, 16, 24], numpy.arange(7, dtype=numpy.int32).tobytes(), numpy.int32)
+        a[[True, False, True]] = JaggedArray.fromiter([[10, 20, 30], [40]])
+        self.assertEqual(a.content.view(numpy.int32).tolist(), [0, 10, 20, 30, 40, 40, 6])
+        a[[2, 0]] = [1, 2, 3, 4, 5]
+        self.assertEqual(a.tolist(), [[3, 4, 5], [], [1, 2]])
+
+    def test_jagged_sort(self):
+        a = JaggedArray.fromiter([[3.3, 1.1, 2.2], [], [5.5, 4.4], [6.6, 9.9, 6.6, 7.7]])
+        self.assertEqual(a.argsort().tolist(), [[1, 2, 0], [], [1, 0], [0, 2, 3, 1]])
+        self.assertEqual(a.argsort(ascending=False).tolist(), [[0, 2, 1], [], [0, 1], [1, 3, 0, 2]])
+        self.assertEqual(a.sort().tolist(), [[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6, 6.6, 7.7, 9.9]])
+        self.assertEqual(a[::-1].sort(ascending=False).tolist(), [[9.9, 7.7, 6.6, 6.6], [5.5, 4.4], [], [3.3, 2.2, 1.1]])
+        self.assertEqual(a.sort().offsets.tolist(), [0, 3, 3, 5, 9])
+        self.assertEqual(ByteJaggedArray.fromiter([[3, 1, 2], [5, 4]]).sort().tolist(), [[1, 2, 3], [4, 5]])
+
+    def test_jagged_unique(self):
+        a = JaggedArray.fromiter([[3, 1, 3, 2, 1], [], [5], [7, 7, 7]])
+        self.assertEqual(a.unique().tolist(), [[1, 2, 3], [], [5], [7]])
+        self.assertEqual(a.unique(return_counts=True)[1].tolist(), [[2, 1, 2], [], [1], [3]])
+        self.assertEqual(a.count_unique().tolist(), [3, 0, 1, 1])
+        self.assertEqual(a[::-1].unique().tolist(), [[7], [5], [], [1, 2, 3]])
+        self.assertEqual(ByteJaggedArray.fromiter([[2, 2, 1], [4]]).unique().tolist(), [[1, 2], [4]])
+
+    def test_jagged_searchsorted(self):
+        a = JaggedArray.fromiter([[1.0, 2.0, 2.0, 5.0], [], [3.0, 10.0]])
+        self.assertEqual(a.searchsorted(JaggedArray.fromiter([[2.0, 0.0, 6.0], [1.0], [4.0]])).tolist(), [[1, 0, 4], [0], [1]])
+        self.assertEqual(a.searchsorted(JaggedArray.fromiter([[2.0], [], [10.0]]), side="right").tolist(), [[3], [], [2]])
+        self.assertEqual(a.searchsorted([2.0, 2.0, 2.0]).tolist(), [1, 0, 0])
+        self.assertEqual(a[::-1].searchsorted(4.0).tolist(), [1, 0, 3])
+
+        # gaps between sublists and NaN (sorted last, as in numpy.searchsorted)
+        b = JaggedArray([4, 0, 9], [7, 3, 9], [1.0, 2.0, numpy.nan, 99.0, 0.0, 5.0, numpy.nan, -99.0, -99.0])
+        for side in ("left", "right"):
+            for value in (0.0, 2.0, 5.0, numpy.nan):
+                self.assertEqual(b.searchsorted(value, side=side).tolist(), [numpy.searchsorted(numpy.array(x), value, side=side) for x in b])
+        self.assertRaises(ValueError, lambda: a.searchsorted(1.0, side="middle"))
+
+    def test_jagged_histogram(self):
+        a = JaggedArray.fromiter([[0.5, 1.5, 2.5, 3.0], [], [1.0, 9.0], [-1.0, 2.0]])
+        self.assertEqual(a.histogram(3, range=(0, 3))[0].tolist(), [1, 2, 3])
+        self.assertEqual(a.histogram(4)[0].tolist(), numpy.histogram(a.flatten(), 4)[0].tolist())
+        self.assertEqual(a[::-1].histogram([0, 1, 2, 3], per_event_weights=[1.0, 2.0, 3.0, 4.0])[0].tolist(), [4.0, 6.0, 9.0])
+        self.assertEqual(a.histogram([0, 1, 2, 3], weights=a*0 + 2, per_event_weights=[1.0, 2.0, 3.0, 4.0])[0].tolist(), [2.0, 8.0, 12.0])
+
+        # per-event weights gathered over several blocks of content
+        random = numpy.random.RandomState(12345)
+        counts = random.poisson(3, 100)
+        b = JaggedArray.fromcounts(counts, random.uniform(0, 1, counts.sum()))[::-1]
+        b.HISTOGRAM_BLOCK = 7
+        eventweights = random.uniform(0, 1, 100)
+        expected = numpy.histogram(b.flatten(), 10, range=(0, 1), weights=numpy.repeat(eventweights, b.counts) * 2)[0]
+        numpy.testing.assert_allclose(b.histogram(10, weights=b*0 + 2, per_event_weights=eventweights, range=(0, 1))[0], expected)
+
+    def test_jagged_topk(self):
+        a = JaggedArray.fromiter([[3.3, 1.1, 2.2], [], [5.5], [6.6, 9.9, 6.6, 7.7]])
+        self.assertEqual(a.argtopk(2).tolist(), [[0, 2], [], [0], [1, 3]])
+        self.assertEqual(a.topk(2).tolist(), [[3.3, 2.2], [], [5.5], [9.9, 7.7]])
+        self.assertEqual(a.topk(10).tolist(), a.sort(ascending=False).tolist())
+        self.assertEqual(a.topk(0).tolist(), [[], [], [], []])
+        self.assertEqual(a[::-1].topk(1).tolist(), [[9.9], [5.5], [], [3.3]])
+        pt = JaggedArray.fromiter([[10, 30, 20], [], [5], [1, 2, 3, 4]])
+        self.assertEqual(a.topk(2, by=pt).tolist(), [[1.1, 2.2], [], [5.5], [7.7, 6.6]])
+        self.assertRaises(ValueError, lambda: a.topk(2, by=JaggedArray.fromiter([[1], [], [], []])))
+
+        # both sides of TOPK_MAXROUNDS agree with a descending sort, including ties and NaN
+        random = numpy.random.RandomState(12345)
+        counts = random.poisson(2 * JaggedArray.TOPK_MAXROUNDS, 200)
+        content = random.randint(0, 5, counts.sum()).astype(numpy.float64)
+        content[random.uniform(0, 1, len(content)) < 0.05] = numpy.nan
+        a = JaggedArray.fromcounts(counts, content)
+        for b in (a, a[::-1]):
+            ordered = b.argsort(ascending=False).tolist()
+            for k in (1, JaggedArray.TOPK_MAXROUNDS, JaggedArray.TOPK_MAXROUNDS + 1, 10 * JaggedArray.TOPK_MAXROUNDS):
+                self.assertEqual(b.argtopk(k).tolist(), [x[:k] for x in ordered])
+
     def test_jagged_argproduct(self):
         starts1 = [0,1,4,4]
         stops1 = [1,4,4,8]
@@ -215,5 +588,36 @@ class TestJagged(unittest.TestCase):
         arr_argproduct = arr1.argproduct(arr2)
         self.assertTrue((list(arr_argproduct._content._content.values())[0]==list([0,4,5,6,7])).all())
         self.assertTrue((list(arr_argproduct._content._content.values())[1]==list([0,4,4,4,4])).all())
+        self.assertEqual(arr_argproduct.counts.tolist(), [1, 0, 0, 4])
+        self.assertEqual(len(arr_argproduct.content), 5)
+
+    def test_jagged_product(self):
+        a = JaggedArray.fromiter([[1, 2], [], [3], [4, 5]])
+        b = JaggedArray.fromiter([[10, 20, 30], [40], [], [50]])
+        self.assertEqual([[(x["f0"], x["f1"]) for x in y] for y in a.product(b).tolist()], [[(1, 10), (1, 20), (1, 30), (2, 10), (2, 20), (2, 30)], [], [], [(4, 50), (5, 50)]])
+
+        chunks = list(a.productchunks(b, 2))
+        self.assertEqual([len(x) for x in chunks], [1, 3])
+        self.assertEqual([y for x in chunks for y in x.tolist()], a.product(b).tolist())
+        self.assertEqual([y for x in a.argproductchunks(b, 4) for y in x.tolist()], a.argproduct(b).tolist())
+
+    def test_jagged_cross(self):
+        a = JaggedArray.fromiter([[1, 2], [], [3], [4, 5]])
+        b = JaggedArray.fromiter([[10, 20, 30], [40], [], [50]])
+        c = JaggedArray.fromiter([[100], [200, 300], [400], [500, 600]])
+        self.assertEqual([[(x["f0"], x["f1"], x["f2"]) for x in y] for y in a.cross(b, c).tolist()], [[(1, 10, 100), (1, 20, 100), (1, 30, 100), (2, 10, 100), (2, 20, 100), (2, 30, 100)], [], [], [(4, 50, 500), (4, 50, 600), (5, 50, 500), (5, 50, 600)]])
+        self.assertEqual([[(x["f0"], x["f1"], x["f2"]) for x in y] for y in a.argcross(b, c).tolist()], [[(0, 0, 0), (0, 1, 0), (0, 2, 0), (1, 0, 0), (1, 1, 0), (1, 2, 0)], [], [], [(3, 4, 4), (3, 4, 5), (4, 4, 4), (4, 4, 5)]])
+        self.assertEqual(a.cross(b).tolist(), a.product(b).tolist())
+        self.assertTrue(isinstance(a.cross(b, c).content._content["f2"], IndexedArray))
+        self.assertRaises(ValueError, lambda: a.cross(b, JaggedArray.fromiter([[1]])))
+
+    def test_jagged_choose(self):
+        a = JaggedArray.fromiter([[1, 2, 3], [], [4], [5, 6], [7, 8, 9, 10]])
+        self.assertEqual([[(x["f0"], x["f1"]) for x in y] for y in a.pairs().tolist()], [[(1, 2), (1, 3), (2, 3)], [], [], [(5, 6)], [(7, 8), (7, 9), (7, 10), (8, 9), (8, 10), (9, 10)]])
+        self.assertEqual(a.pairs().counts.tolist(), [3, 0, 0, 1, 6])
+        self.assertEqual([[(x["f0"], x["f1"]) for x in y] for y in a.argpairs().tolist()], [[(0, 1), (0, 2), (1, 2)], [], [], [(4, 5)], [(6, 7), (6, 8), (6, 9), (7, 8), (7, 9), (8, 9)]])
+        self.assertEqual([[(x["f0"], x["f1"], x["f2"]) for x in y] for y in a.choose(3).tolist()], [[(1, 2, 3)], [], [], [], [(7, 8, 9), (7, 8, 10), (7, 9, 10), (8, 9, 10)]])
+        self.assertEqual(JaggedArray([], [], []).pairs().tolist(), [])
+        self.assertRaises(ValueError, lambda: a.choose(0))
 
 
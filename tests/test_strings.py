@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+import numpy
+
+from awkward import *
+
+class TestStrings(unittest.TestCase):
+    def runTest(self):
+        pass
+
+    def test_strings_fromiter(self):
+        a = StringArray.fromiter([u"one", u"two", u"", u"three", u"héllo"])
+        self.assertEqual(a.tolist(), [u"one", u"two", u"", u"three", u"héllo"])
+        self.assertEqual(a.counts.tolist(), [3, 3, 0, 5, 6])
+        self.assertEqual(a[4], u"héllo")
+        self.assertEqual(a[1:3].tolist(), [u"two", u""])
+        self.assertEqual(a[[4, 0]].tolist(), [u"héllo", u"one"])
+        self.assertEqual(StringArray.fromiter([]).tolist(), [])
+
+    def test_strings_fromoffsets(self):
+        a = StringArray.fromoffsets(numpy.array([0, 3, 3, 5]), b"abcde")
+        self.assertEqual(a.tolist(), [u"abc", u"", u"de"])
+        b = StringArray.fromoffsets(numpy.array([0, 2, 3]), b"ab\xff", encoding=None)
+        self.assertEqual(b.tolist(), [b"ab", b"\xff"])
+        self.assertEqual(b[1], b"\xff")
+
+    def test_strings_length(self):
+        a = StringArray.fromiter([u"one", u"", u"héllo", u"☃☃"])
+        self.assertEqual(a.length().tolist(), [3, 0, 5, 2])
+        self.assertEqual(a.counts.tolist(), [3, 0, 6, 6])
+        self.assertEqual(StringArray.fromiter([u"x", u"yy"], encoding="utf-16").length().tolist(), [1, 2])
+
+    def test_strings_equal(self):
+        a = StringArray.fromiter([u"one", u"two", u"", u"three", u"twp", u"two"])
+        self.assertEqual((a == u"two").tolist(), [False, True, False, False, False, True])
+        self.assertEqual((a != u"two").tolist(), [True, False, True, True, True, False])
+        self.assertEqual((u"two" == a).tolist(), [False, True, False, False, False, True])
+        self.assertEqual((a == u"").tolist(), [False, False, True, False, False, False])
+        b = StringArray.fromiter([u"one", u"too", u"", u"three", u"twp", u"two2"])
+        self.assertEqual((a == b).tolist(), [True, False, True, True, True, False])
+        self.assertEqual((a[::-1] == b[::-1]).tolist(), [False, True, True, True, False, True])
+        self.assertEqual(a[a == u"two"].tolist(), [u"two", u"two"])
+
+    def test_strings_startswith(self):
+        a = StringArray.fromiter([u"one", u"two", u"", u"three", u"t"])
+        self.assertEqual(a.startswith(u"t").tolist(), [False, True, False, True, True])
+        self.assertEqual(a.startswith(u"th").tolist(), [False, False, False, True, False])
+        self.assertEqual(a.startswith(u"").tolist(), [True, True, True, True, True])
+
+    def test_strings_tolist_utf8(self):
+        a = StringArray.fromiter([u"one", u"", u"héllo", u"☃x☃", u"a"])
+        self.assertEqual(a[::-1].tolist(), [u"a", u"☃x☃", u"héllo", u"", u"one"])
+        b = StringArray([0, 4], [3, 6], numpy.frombuffer(b"abc\xff\xc3\xa9", dtype=numpy.uint8))
+        self.assertEqual(b.tolist(), [u"abc", u"é"])
+
+        # a string that starts or stops inside a character is an error, as in __getitem__
+        c = StringArray([1], [3], numpy.frombuffer(b"\xc3\xa9ab", dtype=numpy.uint8))
+        self.assertRaises(UnicodeDecodeError, lambda: c[0])
+        self.assertRaises(UnicodeDecodeError, lambda: c.tolist())
+        d = StringArray([0], [1], numpy.frombuffer(b"\xc3\xa9ab", dtype=numpy.uint8))
+        self.assertRaises(UnicodeDecodeError, lambda: d.tolist())